@@ -0,0 +1,182 @@
+"""
+Benchmark suite for comparing versions: python -m sudokupy.benchmarks.suite --output results.json
+"""
+import sys
+sys.path.append('..')
+import argparse
+import json
+import platform
+import re
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from sudokupy.board import Board
+from sudokupy.cell import Cells
+from sudokupy.deducers.deducer import Deducer, Deducers
+from sudokupy.file import File
+from sudokupy.generator import Generator, Difficulty
+from sudokupy.solver import Solver, Engine
+
+BENCHMARKS = ['solve', 'deducers', 'generator', 'file']
+
+def _measure(func:Callable[[Any], Any], warmups:int=1, repetitions:int=5,
+        setup:Callable[[], Any]=None) -> List[float]:
+    # setup runs before each call and is not timed
+    times = []
+    for i in range(warmups + repetitions):
+        arg = setup() if setup is not None else None
+        time1 = time.perf_counter()
+        func(arg)
+        time2 = time.perf_counter()
+        if i >= warmups:
+            times.append(time2 - time1)
+    return times
+
+def summarize(times:List[float]) -> Dict[str, float]:
+    times = sorted(times)
+    summary = {
+        'count': len(times),
+        'min': times[0],
+        'median': statistics.median(times),
+        'mean': statistics.fmean(times),
+        'p90': times[min(len(times) - 1, int(round(0.9 * (len(times) - 1))))],
+        'max': times[-1],
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+    return summary
+
+def _get_fixtures() -> Dict[str, List[str]]:
+    # boards/<difficulty><number>.csv, grouped by difficulty
+    fixtures = {}
+    for path in sorted(File().get_folder().glob('*.csv')):
+        difficulty = re.sub(r'\d+$', '', path.stem)
+        fixtures.setdefault(difficulty, []).append(path.name)
+    return fixtures
+
+def bench_solve(warmups:int=1, repetitions:int=5, engine:Engine=Engine.DEDUCTION, seed:int=0) -> Dict[str, Any]:
+    # every repetition is seeded alike, so it follows the same search path
+    results = {}
+    for difficulty, filenames in _get_fixtures().items():
+        times = []
+        for filename in filenames:
+            board = Board(filename)
+            times.extend(_measure(lambda solver: solver.solve(), warmups, repetitions,
+                setup=lambda: Solver(board, engine=engine, seed=seed)))
+        results[difficulty] = summarize(times)
+        results[difficulty]['boards'] = len(filenames)
+    return results
+
+def _get_deducer_methods(deducer:Deducer) -> Dict[Deducers, Callable[[Cells], None]]:
+    return {
+        Deducers.VALUE_DEDUCER: deducer.deduce_value,
+        Deducers.SINGLE_CANDIDATE_DEDUCER: deducer.deduce_single_candidate,
+        Deducers.COMPANION_DEDUCER: deducer.deduce_companion,
+        Deducers.LINEBOX_DEDUCER: deducer.deduce_linebox,
+        Deducers.VERTEX_DEDUCER: deducer.deduce_vertex,
+    }
+
+def _make_candidate_board(filename:str) -> Board:
+    # candidates as they are once the givens have been eliminated from their peers
+    board = Board(filename)
+    deducer = Deducer(board.cells)
+    for unit in range(27):
+        deducer.deduce_value(board.cells.get_unit(unit))
+    deducer.eliminate()
+    return board
+
+def bench_deducers(warmups:int=1, repetitions:int=5) -> Dict[str, Any]:
+    # one full scan of every unit a technique covers, on each fixture board
+    boards = [_make_candidate_board(filename) for filenames in _get_fixtures().values() for filename in filenames]
+    results = {}
+    for technique, units in Deducer.TECHNIQUES.items():
+        times = []
+        for board in boards:
+            def scan(deducer:Deducer):
+                deduce = _get_deducer_methods(deducer)[technique]
+                cells = deducer._cells
+                for unit in units:
+                    deduce(cells.get_unit(unit))
+            times.extend(_measure(scan, warmups, repetitions, setup=lambda: Deducer(board.cells.copy())))
+        summary = summarize(times)
+        summary['units_per_second'] = len(units) / summary['median']
+        results[technique.name] = summary
+    return results
+
+def bench_generator(warmups:int=1, repetitions:int=5, difficulty:Difficulty=Difficulty.Medium) -> Dict[str, Any]:
+    seeds = iter(range(warmups + repetitions))
+    times = _measure(lambda _: Generator().generate(difficulty, next(seeds)), warmups, repetitions)
+    summary = summarize(times)
+    summary['boards_per_second'] = 1 / summary['median']
+    return {difficulty.name: summary}
+
+def bench_file(warmups:int=1, repetitions:int=5, puzzle_count:int=10000) -> Dict[str, Any]:
+    file = File()
+    filenames = [filename for filenames in _get_fixtures().values() for filename in filenames]
+    results = {}
+    times = _measure(lambda _: [file.read_csv(filename) for filename in filenames], warmups, repetitions)
+    results['read_csv'] = summarize([t / len(filenames) for t in times])
+
+    cells_list = [file.read_csv(filename) for filename in filenames]
+    cells_list = (cells_list * (puzzle_count // len(cells_list) + 1))[:puzzle_count]
+    with tempfile.TemporaryDirectory() as folder:
+        file = File(folder)
+        file.to_lines(cells_list, 'puzzles.txt')
+        file.to_store(cells_list, 'puzzles.sdk')
+        times = _measure(lambda _: sum(1 for _ in file.iter_lines('puzzles.txt')), warmups, repetitions)
+        results['iter_lines'] = summarize([t / puzzle_count for t in times])
+        with file.open_store('puzzles.sdk') as store:
+            times = _measure(lambda _: sum(1 for _ in store), warmups, repetitions)
+        results['store'] = summarize([t / puzzle_count for t in times])
+    for summary in results.values():
+        summary['puzzles_per_second'] = 1 / summary['median']
+    return results
+
+def run(benchmarks:List[str]=None, warmups:int=1, repetitions:int=5,
+        engine:Engine=Engine.DEDUCTION, output:str=None, seed:int=0) -> Dict[str, Any]:
+    if benchmarks is None:
+        benchmarks = BENCHMARKS
+    for benchmark in benchmarks:
+        if benchmark not in BENCHMARKS:
+            raise ValueError(f'unknown benchmark {benchmark} (choose from {BENCHMARKS})')
+    report = {
+        'metadata': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'warmups': warmups,
+            'repetitions': repetitions,
+            'engine': engine.name,
+            'seed': seed,
+        },
+        'results': {},
+    }
+    results = report['results']
+    for benchmark in benchmarks:
+        if benchmark == 'solve':
+            results['solve'] = bench_solve(warmups, repetitions, engine, seed)
+        elif benchmark == 'deducers':
+            results['deducers'] = bench_deducers(warmups, repetitions)
+        elif benchmark == 'generator':
+            results['generator'] = bench_generator(warmups, repetitions)
+        elif benchmark == 'file':
+            results['file'] = bench_file(warmups, repetitions)
+    if output is not None:
+        Path(output).write_text(json.dumps(report, indent=2))
+    return report
+
+def main(argv:List[str]=None):
+    parser = argparse.ArgumentParser(description='Run the SudokuPy benchmark suite')
+    parser.add_argument('benchmarks', nargs='*', help=f'any of {BENCHMARKS} (default: all)')
+    parser.add_argument('--warmups', type=int, default=1)
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--engine', choices=[engine.name for engine in Engine], default=Engine.DEDUCTION.name)
+    parser.add_argument('--output', help='write the JSON report to this file')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the solver\'s guesses')
+    args = parser.parse_args(argv)
+    report = run(args.benchmarks or None, args.warmups, args.repetitions, Engine[args.engine], args.output, args.seed)
+    print(json.dumps(report, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -14,7 +14,7 @@ def time_board_generator(from_seed:int=0, to_seed:int=100):
             'seed': i,
             'time': round(time2-time1, 2), 
             'is_complete': g._is_board_complete(),
-            'injections': len(g._injector.get_history())
+            'injections': g._injector.push_count + g._injector.pop_count
         }
         results.append(d)
         print(d)
@@ -0,0 +1,38 @@
+import sys
+sys.path.append('..')
+import subprocess
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent.parent
+
+_IMPORT_SCRIPT = '''
+import sys, time
+time1 = time.perf_counter()
+import {module}
+time2 = time.perf_counter()
+print(time2 - time1, 'tkinter' in sys.modules, 'multiprocessing' in sys.modules)
+'''
+
+def time_import(module:str='sudokupy.solver', repetitions:int=10):
+    # each import runs in a fresh interpreter, as in a newly spawned worker
+    results = []
+    for i in range(repetitions):
+        time1 = time.perf_counter()
+        output = subprocess.run([sys.executable, '-c', _IMPORT_SCRIPT.format(module=module)],
+            cwd=_ROOT, capture_output=True, text=True, check=True).stdout.split()
+        time2 = time.perf_counter()
+        d = {
+            'module': module,
+            'repetition': i,
+            'import_time': round(float(output[0]), 4),
+            'process_time': round(time2-time1, 4),
+            'imports_tkinter': output[1] == 'True',
+            'imports_multiprocessing': output[2] == 'True',
+        }
+        results.append(d)
+        print(d)
+    return results
+
+if __name__ == '__main__':
+    time_import(*sys.argv[1:2])
@@ -1,9 +1,11 @@
 import sys
 sys.path.append('..')
-from sudokupy.cell import Cells
+from sudokupy.cell import Cells, mask_to_values
+from sudokupy.grid import Grid
+from sudokupy.geometry import CELL_UNITS, UNITS, get_index, get_position
 from sudokupy.file import File
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 from pathlib import Path
 
 class Board:
@@ -88,6 +90,10 @@ class Board:
     def cells(self) -> Cells:
         return self._cells
     
+    @property
+    def grid(self) -> Grid:
+        return self._cells.grid
+    
     def to_csv(self, filename:str, folder:str=None) -> Path:
         file = File(folder)
         file.to_csv(self.cells, filename)
@@ -109,6 +115,21 @@ class Board:
         board.cell = board.Cell(cells)
         return board
     
+    @classmethod
+    def from_grid(self, grid:Grid) -> 'Board':
+        return Board.from_cells(Cells.from_grid(grid))
+    
+    @classmethod
+    def from_values(self, values:Sequence[int]) -> 'Board':
+        values = bytes(values)
+        if len(values) != 81:
+            raise ValueError(f'values must have 81 elements (len={len(values)})')
+        if max(values) > 9:
+            raise ValueError('cell value must be an integer between 0 and 9')
+        grid = Grid()
+        grid.set_values(values)
+        return Board.from_grid(grid)
+    
     def copy(self) -> 'Board':
         new_cells = self._cells.copy()
         board = Board.from_cells(new_cells)
@@ -137,15 +158,18 @@ class Board:
         return resolved_cells
     
     def resolve_adjacent(self, row:int, col:int) -> List[Tuple[int, int]]:
-        box_cells = self.box[row//3, col//3]
-        row_cells = self.row[row]
-        col_cells = self.col[col]
+        row_unit, col_unit, box_unit = CELL_UNITS[get_index(row, col)]
+        grid = self.grid
 
         resolved_cells = []
 
-        for cells in [box_cells, row_cells, col_cells]:
-            candidates = cells.get_candidates()
-            resolved_cells.extend(self._resolve_selection(candidates))
+        for unit in [box_unit, row_unit, col_unit]:
+            for index in UNITS[unit]:
+                mask = grid.get_mask(index)
+                if mask and not mask & (mask - 1):
+                    self.cells.get_cell(index).set_value(mask_to_values(mask)[0])
+                    grid.set_mask(index, 0)
+                    resolved_cells.append(get_position(index))
         return resolved_cells
 
     def _resolve_selection(self, candidates:List[List[List[int]]]) -> List[Tuple[int, int]]:
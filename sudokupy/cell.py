@@ -1,10 +1,39 @@
-from typing import Union, List
+import sys
+sys.path.append('..')
+from sudokupy.grid import Grid, ALL_CANDIDATES_MASK
+from sudokupy.geometry import ROWS, COLS, BOXES, COL_UNIT_OFFSET, BOX_UNIT_OFFSET
+from typing import Iterator, Union, List
+
+_VALUE_BITS = {value: 1 << (value - 1) for value in range(1, 10)}
+_MASK_VALUES = tuple(
+    tuple(value for value in range(1, 10) if mask & _VALUE_BITS[value])
+    for mask in range(ALL_CANDIDATES_MASK + 1))
+_MASK_COUNTS = tuple(len(values) for values in _MASK_VALUES)
+
+_BOX_STARTS = (0, 3, 6)
+_FULL_SLICE = slice(None)
+
+def values_to_mask(values: Union[int, List[int]]) -> int:
+    if type(values) is int:
+        values = [values]
+    mask = 0
+    for value in values:
+        if value not in _VALUE_BITS:
+            raise ValueError('cell value must be an integer between 1 and 9')
+        mask |= _VALUE_BITS[value]
+    return mask
+
+def mask_to_values(mask: int) -> List[int]:
+    return list(_MASK_VALUES[mask])
+
+def mask_count(mask: int) -> int:
+    return _MASK_COUNTS[mask]
 
 class Candidate:
-    __slots__ = ['_values']
+    __slots__ = ['_mask']
 
-    def __init__(self):
-        self._values = self._get_default_values()
+    def __init__(self, mask: int = ALL_CANDIDATES_MASK):
+        self._mask = self._validate_mask(mask)
     
     def __repr__(self):
         return f'<Candidate\n{self.print_grid()}\n>'
@@ -12,42 +41,70 @@ class Candidate:
     def __str__(self):
         return self.print_grid()
     
+    def __len__(self):
+        return _MASK_COUNTS[self._mask]
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(_MASK_VALUES[self._mask])
+    
+    def __contains__(self, value: int) -> bool:
+        return value in _VALUE_BITS and bool(self._mask & _VALUE_BITS[value])
+    
+    def __and__(self, other: Union['Candidate', int]) -> 'Candidate':
+        return Candidate(self._mask & self._get_other_mask(other))
+    
+    def __or__(self, other: Union['Candidate', int]) -> 'Candidate':
+        return Candidate(self._mask | self._get_other_mask(other))
+    
+    def __eq__(self, other: 'Candidate') -> bool:
+        if not isinstance(other, Candidate):
+            return False
+        return self._mask == other._mask
+    
+    def __hash__(self) -> int:
+        return hash(self._mask)
+    
     @property
     def values(self) -> List[int]:
-        return self._values
+        return list(_MASK_VALUES[self._mask])
     
-    def _get_default_values(self) -> List[int]:
-        return list(range(1, 10))
+    @property
+    def mask(self) -> int:
+        return self._mask
 
     def copy(self) -> 'Candidate':
-        new_candidate = Candidate()
-        new_candidate._values = self._values.copy()
-        return new_candidate
+        return Candidate(self._mask)
     
     def remove(self, values: Union[int, List[int]]):
         if type(values) is int:
             values = [values]
         values = [value for value in values if value != 0]
-        self._validate_values(values)
-        self._values = [v for v in self._values if v not in values]
+        self._mask &= ~values_to_mask(values)
     
     def set(self, values: Union[int, List[int]]):
-        if type(values) is int:
-            values = [values]
-        values = list(set(values))
-        self._validate_values(values)
-        self._values = values
+        self._mask = values_to_mask(values)
+    
+    def remove_mask(self, mask: int):
+        self._mask &= ~mask
+    
+    def set_mask(self, mask: int):
+        self._mask = self._validate_mask(mask)
     
     def _get_removed(self) -> List[int]:
-        return [num for num in range(1, 10) if num not in self._values]
+        return list(_MASK_VALUES[~self._mask & ALL_CANDIDATES_MASK])
     
     def count(self):
-        return len(self._values)
+        return _MASK_COUNTS[self._mask]
 
-    def _validate_values(self, values: List[int]):
-        for value in values:
-            if value not in range(1, 10):
-                raise ValueError('cell value must be an integer between 1 and 9')
+    def _validate_mask(self, mask: int) -> int:
+        if type(mask) is not int or mask < 0 or mask > ALL_CANDIDATES_MASK:
+            raise ValueError(f'mask must be an integer between 0 and {ALL_CANDIDATES_MASK}')
+        return mask
+    
+    def _get_other_mask(self, other: Union['Candidate', int]) -> int:
+        if isinstance(other, Candidate):
+            return other._mask
+        return self._validate_mask(other)
     
     def print_grid(self):
         numbers = [[1,2,3],[4,5,6],[7,8,9]]
@@ -70,29 +127,42 @@ class Candidate:
     
 
 class Cell:
-    __slots__ = ['_row', '_column', '_value', '_candidates', '_is_permanent']
+    """
+    View of one position in a Grid
+    """
+    __slots__ = ['_grid', '_index', '_row', '_column']
 
     def __init__(self, row: int, column: int, value: int=0, is_value_permanent: bool = False):
         self._validate_position(row, 'row')
         self._validate_position(column, 'column')
         self._row = row
         self._column = column
-        self._candidates = Candidate()
-        self._is_permanent = is_value_permanent
+        self._grid = Grid(1)
+        self._index = 0
+        self._grid.set_permanent(0, is_value_permanent)
 
         self.set_value(value)
     
+    @classmethod
+    def _from_grid(cls, grid: Grid, index: int) -> 'Cell':
+        cell = cls.__new__(cls)
+        cell._grid = grid
+        cell._index = index
+        cell._row = index // 9
+        cell._column = index % 9
+        return cell
+    
     def __repr__(self):
-        return f'<Cell ({self._row},{self._column})={self._value}>'
+        return f'<Cell ({self._row},{self._column})={self.value}>'
     
     def __eq__(self, other:'Cell'):
         return self._row == other._row and \
             self._column == other._column
     
     def copy(self) -> 'Cell':
-        cell = Cell(self._row, self._column, self._value)
-        cell._candidates = self._candidates.copy()
-        cell._is_permanent = self._is_permanent
+        cell = Cell(self._row, self._column, self.value)
+        cell._grid.set_mask(0, self.candidate_mask)
+        cell._grid.set_permanent(0, self.is_permanent)
         return cell
 
     @property
@@ -103,26 +173,38 @@ class Cell:
     def column(self) -> int:
         return self._column
     
+    @property
+    def index(self) -> int:
+        return self._index
+    
+    @property
+    def grid(self) -> Grid:
+        return self._grid
+    
     @property
     def candidates(self) -> List[int]:
-        return self._candidates.values
+        return list(_MASK_VALUES[self._grid._masks[self._index]])
     
     @candidates.setter
     def candidates(self, values=Union[int, List[int]]):
         self.set_candidates(values)
     
+    @property
+    def candidate_mask(self) -> int:
+        return self._grid._masks[self._index]
+    
     @property
     def print_value(self) -> str:
-        return str(self._value).replace('0', '.')
+        return str(self.value).replace('0', '.')
     
     @property
     def value(self) -> int:
-        return self._value
+        return self._grid._values[self._index]
     
     @value.setter
     def value(self, value:int):
         self._validate_value(value)
-        self._value = value
+        self._grid.set_value(self._index, value)
     
     @property
     def box(self) -> int:
@@ -138,28 +220,34 @@ class Cell:
     
     @property
     def is_permanent(self):
-        return self._is_permanent
+        return self._grid.is_permanent(self._index)
     
     def set_permanence(self, is_permanent:bool):
-        self._is_permanent = is_permanent
+        self._grid.set_permanent(self._index, is_permanent)
     
     def print_candidates(self):
-        return self._candidates.print_list()
+        return Candidate(self.candidate_mask).print_list()
     
     def set_value(self, value: int):
-        if self._is_permanent:
+        if self.is_permanent:
             raise ValueError(f'value of cell {self.__repr__()} cannot be be changed')
         self._validate_value(value)
-        self._value = value
+        self._grid.set_value(self._index, value)
     
     def reset_candidates(self):
-        self._candidates = Candidate()
+        self._grid.set_mask(self._index, ALL_CANDIDATES_MASK)
     
     def set_candidates(self, values=Union[int, List[int]]):
-        self._candidates.set(values)
+        self._grid.set_mask(self._index, values_to_mask(values))
     
     def remove_candidates(self, values=Union[int, List[int]]):
-        self._candidates.remove(values)
+        if type(values) is int:
+            values = [values]
+        values = [value for value in values if value != 0]
+        self._grid.remove_mask(self._index, values_to_mask(values))
+    
+    def remove_candidate_mask(self, mask:int):
+        self._grid.remove_mask(self._index, mask)
     
     def _validate_position(self, pos: int, pos_name: str):
         if pos not in range(0, 9):
@@ -169,22 +257,63 @@ class Cell:
         if value not in range(0, 10):
             raise ValueError('cell value must be an integer between 0 and 9')
 
+def _get_cell_views(grid: Grid) -> List[Cell]:
+    views = grid._views
+    if views is None:
+        views = [Cell._from_grid(grid, index) for index in range(len(grid))]
+        grid._views = views
+    return views
+
 class Cells:
+    """
+    Rectangular view of the cells of a Grid
+    """
     def __init__(self, _cells:List[List['Cell']]=None):
-        self._data : List[List['Cell']] = [[]]
-        self._row_count = 0
-        self._col_count = 0
+        self._unit_views = None
         if _cells is None:
             self._is_sliced = False
-            self._make_default_cells()
+            self._grid = Grid()
+            self._indices = tuple(range(81))
+            self._row_count = 9
+            self._col_count = 9
         else:
             self._is_sliced = True
             if type(_cells) is not list or type(_cells[0]) is not list or not isinstance(_cells[0][0], Cell):
                 raise ValueError('_cells structure not valid')
-            self._data = _cells
+            grid = _cells[0][0]._grid
+            if len(grid) == 81 and all(cell._grid is grid for row in _cells for cell in row):
+                self._indices = tuple(cell._index for row in _cells for cell in row)
+            else:
+                # standalone cells, or cells of different boards: copied into a new grid at their positions
+                grid = Grid()
+                for row in _cells:
+                    for cell in row:
+                        index = cell._row * 9 + cell._column
+                        grid.set_value(index, cell.value)
+                        grid.set_mask(index, cell.candidate_mask)
+                        grid.set_permanent(index, cell.is_permanent)
+                self._indices = tuple(cell._row * 9 + cell._column for row in _cells for cell in row)
+            self._grid = grid
             self._row_count = len(_cells)
             self._col_count = len(_cells[0])
     
+    @classmethod
+    def _view(cls, grid:Grid, indices:tuple, row_count:int, col_count:int, is_sliced:bool=True) -> 'Cells':
+        cells = cls.__new__(cls)
+        cells._grid = grid
+        cells._indices = indices
+        cells._row_count = row_count
+        cells._col_count = col_count
+        cells._is_sliced = is_sliced
+        cells._unit_views = None
+        return cells
+    
+    @classmethod
+    def from_grid(cls, grid:Grid) -> 'Cells':
+        if len(grid) != 81:
+            raise ValueError('grid must have 81 cells')
+        return cls._view(grid, tuple(range(81)), 9, 9, False)
+    
     def __str__(self):
         return self._print_grid()
     
@@ -195,19 +324,77 @@ class Cells:
         return self._count_data()
     
     def __getitem__(self, key):
+        if not self._is_sliced:
+            unit_view = self._get_unit_view(key)
+            if unit_view is not None:
+                return unit_view
+
         if type(key) is not tuple:
             key = (key,)
 
-        sliced_rows = self._data[key[0]]
-        if type(sliced_rows[0]) is not list: # single row selected
-            sliced_rows = [sliced_rows]
+        rows = range(self._row_count)[key[0]]
+        if type(rows) is int: # single row selected
+            rows = [rows]
         
+        cols = range(self._col_count)
         if len(key) > 1: # column slicer provided
-            sliced_rows = [row[key[1]] for row in sliced_rows]
-            if type(sliced_rows[0]) is not list: # single column selected
-                sliced_rows = [[cell] for cell in sliced_rows]
+            cols = cols[key[1]]
+            if type(cols) is int: # single column selected
+                cols = [cols]
         
-        return Cells(sliced_rows)
+        indices = self._indices
+        col_count = self._col_count
+        sliced = tuple(indices[row * col_count + col] for row in rows for col in cols)
+        return Cells._view(self._grid, sliced, len(rows), len(cols))
+    
+    def _get_unit_view(self, key) -> 'Cells':
+        if type(key) is int:
+            if 0 <= key < 9:
+                return self.get_row(key)
+            return None
+        if type(key) is not tuple or len(key) != 2:
+            return None
+        row_key, col_key = key
+        if type(col_key) is int:
+            if row_key == _FULL_SLICE and 0 <= col_key < 9:
+                return self.get_col(col_key)
+        elif type(row_key) is slice and type(col_key) is slice:
+            row_start = row_key.start
+            col_start = col_key.start
+            if row_start in _BOX_STARTS and col_start in _BOX_STARTS and \
+                    row_key.stop == row_start + 3 and col_key.stop == col_start + 3 and \
+                    row_key.step is None and col_key.step is None:
+                return self.get_box(row_start // 3, col_start // 3)
+        return None
+    
+    def _get_unit_views(self) -> List['Cells']:
+        if self._unit_views is None:
+            grid = self._grid
+            views = [Cells._view(grid, indices, 1, 9) for indices in ROWS]
+            views.extend(Cells._view(grid, indices, 9, 1) for indices in COLS)
+            views.extend(Cells._view(grid, indices, 3, 3) for indices in BOXES)
+            self._unit_views = views
+        return self._unit_views
+    
+    def get_unit(self, unit:int) -> 'Cells':
+        self._validate_unsliced()
+        return self._get_unit_views()[unit]
+    
+    def get_row(self, row:int) -> 'Cells':
+        self._validate_unsliced()
+        return self._get_unit_views()[row]
+    
+    def get_col(self, col:int) -> 'Cells':
+        self._validate_unsliced()
+        return self._get_unit_views()[COL_UNIT_OFFSET + col]
+    
+    def get_box(self, boxrow:int, boxcol:int) -> 'Cells':
+        self._validate_unsliced()
+        return self._get_unit_views()[BOX_UNIT_OFFSET + boxrow * 3 + boxcol]
+    
+    def _validate_unsliced(self):
+        if self._is_sliced:
+            raise ValueError('rows, columns and boxes can only be taken from unsliced Cells')
     
     def __eq__(self, other:'Cells') -> bool:
         if not isinstance(other, Cells):
@@ -225,9 +412,21 @@ class Cells:
     def col_count(self):
         return self._col_count
     
+    @property
+    def grid(self) -> Grid:
+        return self._grid
+    
+    @property
+    def indices(self) -> tuple:
+        return self._indices
+    
     @property
     def data(self) -> List[List[Cell]]:
-        return self._data
+        views = _get_cell_views(self._grid)
+        indices = self._indices
+        col_count = self._col_count
+        return [[views[i] for i in indices[row:row+col_count]] 
+            for row in range(0, len(indices), col_count)]
     
     @property
     def is_sliced(self) -> bool:
@@ -235,11 +434,11 @@ class Cells:
     
     @property
     def topleft_row(self):
-        return self._data[0][0].row
+        return self._indices[0] // 9
     
     @property
     def topleft_column(self):
-        return self._data[0][0].column
+        return self._indices[0] % 9
 
     @property
     def values(self) -> List[List[int]]:
@@ -258,11 +457,8 @@ class Cells:
         self.set_candidates(values)
     
     def copy(self) -> 'Cells':
-        new_cells = Cells()
-        for i in range(len(new_cells._data)):
-            for j in range(len(new_cells._data[0])):
-                new_cells._data[i][j] = self._data[i][j].copy()
-        return new_cells
+        return Cells._view(self._grid.copy(), self._indices, 
+            self._row_count, self._col_count, self._is_sliced)
     
     def contains(self, values: Union[int, List[int]]) -> bool:
         if type(values) is int:
@@ -272,50 +468,36 @@ class Cells:
             if value not in range(9):
                 raise ValueError(f'value must be an int between 0 and 9. Received [{value}]')
         
-        cell_values = self._flatten(self.values)
+        cell_values = self.get_values(flatten=True)
         return all([value in cell_values for value in values])
     
     def reset_candidates(self):
-        for row in self._data:
-            for cell in row:
-                cell.reset_candidates()
+        for i in self._indices:
+            self._grid.set_mask(i, ALL_CANDIDATES_MASK)
 
     def remove_candidates(self, values:Union[int, List[int]]):
-        for row in self._data:
-            for cell in row:
-                cell.remove_candidates(values)
+        if type(values) is int:
+            values = [values]
+        values = [value for value in values if value != 0]
+        mask = values_to_mask(values)
+        for i in self._indices:
+            self._grid.remove_mask(i, mask)
 
     def set_candidates(self, values:Union[int, List[int]]):
         if type(values) is int:
             values = [values]
         
-        if len(values) == 0:
-            for cell in self.flatten():
-                cell.set_candidates(values)
-        elif type(values[0]) in [list, tuple]:
-            for i, cell in enumerate(self.flatten()):
-                cell.set_candidates(values[i])
+        if len(values) > 0 and type(values[0]) in [list, tuple]:
+            for i, index in enumerate(self._indices):
+                self._grid.set_mask(index, values_to_mask(values[i]))
         else:
-            for cell in self.flatten():
-                cell.set_candidates(values)
-        
-
-    def _make_default_cells(self):
-        row_count = 9
-        col_count = 9
-        cells = []
-        for r in range(row_count):
-            row = []
-            for c in range(col_count):
-                row.append(Cell(r, c, 0))
-            cells.append(row)
-        self._data = cells
-        self._row_count = row_count
-        self._col_count = col_count
+            mask = values_to_mask(values)
+            for index in self._indices:
+                self._grid.set_mask(index, mask)
     
     def set_values(self, values: Union[int, List[int], List[List[int]]]):
         flat_values = self._flatten(values)
-        flat_data = self._flatten(self._data)
+        flat_data = self.flatten()
 
         if len(flat_values) != len(flat_data):
             raise ValueError(f'values (len={len(flat_values)}) '\
@@ -326,30 +508,35 @@ class Cells:
             flat_data[i].set_value(value)
     
     def get_values(self, flatten=False) -> Union[List[List[int]], List[int]]:
-        values = [[cell.value for cell in row] for row in self._data]
-        if flatten:
-            values = self._flatten(values)
+        grid_values = self._grid._values
+        values = [grid_values[i] for i in self._indices]
+        if not flatten:
+            values = self._unflatten(values)
         return values
     
     def get_candidates(self, flatten=False) -> Union[List[List[List[int]]], List[List[int]]]:
-        candidates = [[cell.candidates for cell in row] for row in self._data]
-        if flatten:
-            candidates = self._flatten(candidates)
+        masks = self._grid._masks
+        candidates = [list(_MASK_VALUES[masks[i]]) for i in self._indices]
+        if not flatten:
+            candidates = self._unflatten(candidates)
         return candidates
     
     def flatten(self) -> List[Cell]:
-        flattened_cells = []
-        for row in self.data:
-            for cell in row:
-                flattened_cells.append(cell)
-        return flattened_cells
+        views = _get_cell_views(self._grid)
+        return [views[i] for i in self._indices]
+    
+    def get_cell(self, index:int) -> Cell:
+        return _get_cell_views(self._grid)[index]
     
     def as_cell(self) -> Cell:
-        if len(self.data) == 1:
-            if len(self.data[0]) == 1:
-                return self.data[0][0]
+        if len(self._indices) == 1:
+            return _get_cell_views(self._grid)[self._indices[0]]
         raise ValueError('Cells object has more than 1 instance of Cell')
 
+    def _unflatten(self, items:List) -> List[List]:
+        col_count = self._col_count
+        return [items[row:row+col_count] for row in range(0, len(items), col_count)]
+
     def _flatten(self, matrix) -> List:
 
         if type(matrix) not in [list, tuple]:
@@ -413,7 +600,8 @@ class Cells:
             print_box = True
         else:
             print_box = False
-        grid = _print_header(self._data[0], print_box) + _print_rows(self._data, print_box)
+        data = self.data
+        grid = _print_header(data[0], print_box) + _print_rows(data, print_box)
         return grid
     
     def print_candidates(self):
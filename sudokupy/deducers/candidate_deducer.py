@@ -1,6 +1,7 @@
 import sys
 sys.path.append('../..')
-from sudokupy.cell import Cell, Cells
+from sudokupy.cell import Cell, Cells, mask_count
+from sudokupy.geometry import PEERS
 from sudokupy.deducers.deducer_base import _BaseDeducer 
 from typing import List
 
@@ -10,30 +11,21 @@ class SingleCandidateDeducer(_BaseDeducer):
         self._cells = cells
         self._checked_cells:List[Cell]=[]
     
+    def reset(self):
+        super().reset()
+        self._checked_cells = []
+    
     def deduce(self, sliced_cells:Cells):
         for cell in sliced_cells.flatten():
             if cell not in self._checked_cells:
-                if len(cell.candidates) == 1:
+                if mask_count(cell.candidate_mask) == 1:
                     self._deduce_adjacent(cell)
                     self._checked_cells.append(cell)
     
     def _deduce_adjacent(self, cell:Cell):
-        row = cell.row
-        col = cell.column
-
-        rows = self._cells[row].flatten()
-        cols = self._cells[:, col].flatten()
-        topleft_row = (row//3) * 3
-        topleft_col = (col//3) * 3
-        boxes = self._cells[topleft_row:topleft_row+3, topleft_col:topleft_col+3].flatten()
-
-        rows.remove(cell)
-        cols.remove(cell)
-        boxes.remove(cell)
-
-        adjacent_cells = rows + cols + boxes
+        masks = self._cells.grid.masks
 
-        candidate = cell.candidates[0]
-        for adjacent_cell in adjacent_cells:
-            if candidate in adjacent_cell.candidates:
-                self._add_transaction(adjacent_cell, candidate)
+        candidate_mask = cell.candidate_mask
+        for index in PEERS[cell.row * 9 + cell.column]:
+            if masks[index] & candidate_mask:
+                self._add_transaction_mask(self._cells.get_cell(index), candidate_mask)
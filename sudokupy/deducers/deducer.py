@@ -6,9 +6,12 @@ from sudokupy.deducers.linebox_deducer import LineBoxDeducer
 from sudokupy.deducers.value_deducer import ValueDeducer
 from sudokupy.deducers.candidate_deducer import SingleCandidateDeducer
 from sudokupy.deducers.vertex_deducer import VertexCoupleDeducer
-from sudokupy.cell import Cells
-from typing import List, Union
+from sudokupy.cell import Cell, Cells, mask_count
+from sudokupy.geometry import CELL_UNITS
+from typing import Callable, Dict, List, Mapping, Optional, Set, Union
+from types import MappingProxyType
 from enum import Enum
+from time import perf_counter
 
 class Deducers(Enum):
     VALUE_DEDUCER = 0
@@ -17,7 +20,39 @@ class Deducers(Enum):
     LINEBOX_DEDUCER = 3
     VERTEX_DEDUCER = 4
 
+# units each technique scans: rows 0-8, columns 9-17, boxes 18-26
+_DEDUCER_UNITS = {
+    Deducers.VALUE_DEDUCER: range(27),
+    Deducers.SINGLE_CANDIDATE_DEDUCER: range(9),
+    Deducers.COMPANION_DEDUCER: range(27),
+    Deducers.LINEBOX_DEDUCER: range(18),
+    Deducers.VERTEX_DEDUCER: range(18),
+}
+
+class DeducerStats:
+    """
+    Counters for one deduction technique
+    """
+    __slots__ = ['calls', 'time', 'transactions', 'eliminated']
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.transactions = 0
+        self.eliminated = 0
+    
+    def __repr__(self):
+        return f'<DeducerStats calls:{self.calls} time:{self.time:.6f} transactions:{self.transactions} eliminated:{self.eliminated}>'
+    
+    def to_dict(self) -> dict:
+        return {'calls': self.calls, 'time': self.time, 'transactions': self.transactions, 'eliminated': self.eliminated}
+
 class Deducer(_BaseDeducer):
+    """
+    Runs the deduction techniques in order of cost
+    """
+    # read-only: the units each technique scans
+    TECHNIQUES: Mapping[Deducers, range] = MappingProxyType(_DEDUCER_UNITS)
+
     def __init__(self, cells: Cells):
         super().__init__('Deducer')
         self._cells = cells
@@ -26,20 +61,16 @@ class Deducer(_BaseDeducer):
         self.companion_deducer = CompanionDeducer()
         self.linebox_deducer = LineBoxDeducer(cells)
         self.vertex_deducer = VertexCoupleDeducer(cells)
+        for sub_deducer in self._get_sub_deducers().values():
+            sub_deducer._transactions = self._transactions
         self._states = self._reset_states()
-    
-    @property
-    def transactions(self):
-        tx = []
-        deducers:List[_BaseDeducer] = [self.value_deducer, self.single_candidate_deducer, self.companion_deducer, self.linebox_deducer, self.vertex_deducer]
-        for deducer in deducers:
-            t = deducer._transactions.get_transactions()
-            tx.extend(t)
-        return tx
+        self._pending_units = self._reset_pending_units()
+        self._stats: Optional[Dict[Deducers, DeducerStats]] = None
     
     def is_solvable(self) -> bool:
-        for cell in self._cells.flatten():
-            if cell.value == 0 and cell.candidates == []:
+        grid = self._cells.grid
+        for index in self._cells.indices:
+            if grid.get_value(index) == 0 and grid.get_mask(index) == 0:
                 return False
         return True
     
@@ -65,6 +96,29 @@ class Deducer(_BaseDeducer):
     def disable_vertex_deducer(self):
         self._set_state(Deducers.VERTEX_DEDUCER, False)
 
+    @property
+    def stats(self) -> Optional[Dict[Deducers, DeducerStats]]:
+        return self._stats
+    
+    def enable_stats(self):
+        if self._stats is None:
+            self.reset_stats()
+    
+    def disable_stats(self):
+        self._stats = None
+    
+    def reset_stats(self):
+        self._stats = {deducer: DeducerStats() for deducer in Deducers}
+    
+    def _get_sub_deducers(self) -> 'dict[Deducers, _BaseDeducer]':
+        return {
+            Deducers.VALUE_DEDUCER: self.value_deducer,
+            Deducers.SINGLE_CANDIDATE_DEDUCER: self.single_candidate_deducer,
+            Deducers.COMPANION_DEDUCER: self.companion_deducer,
+            Deducers.LINEBOX_DEDUCER: self.linebox_deducer,
+            Deducers.VERTEX_DEDUCER: self.vertex_deducer,
+        }
+
     def _reset_states(self) -> 'dict[Deducers, List[Union[bool, int]]]':
         d = {}
         d[Deducers.VALUE_DEDUCER] = [True, None]
@@ -74,6 +128,41 @@ class Deducer(_BaseDeducer):
         d[Deducers.VERTEX_DEDUCER] = [True, 3]
         return d
 
+    def _reset_pending_units(self) -> 'dict[Deducers, Set[int]]':
+        return {deducer: set(units) for deducer, units in _DEDUCER_UNITS.items()}
+    
+    def _pop_pending_units(self, deducer:Deducers) -> List[int]:
+        units = sorted(self._pending_units[deducer])
+        self._pending_units[deducer].clear()
+        return units
+    
+    def mark_dirty(self, cells:List[Cell]):
+        for cell in cells:
+            cell_units = CELL_UNITS[cell.row * 9 + cell.column]
+            for deducer, pending_units in self._pending_units.items():
+                unit_count = len(_DEDUCER_UNITS[deducer])
+                for unit in cell_units:
+                    if unit < unit_count:
+                        pending_units.add(unit)
+    
+    def mark_all_dirty(self):
+        self._pending_units = self._reset_pending_units()
+    
+    def invalidate(self):
+        """
+        Forget everything learned about the board, e.g. after a guess is rolled back
+        """
+        self.clear_transactions()
+        self.single_candidate_deducer.reset()
+        self.vertex_deducer.reset()
+        self.mark_all_dirty()
+    
+    def reset(self):
+        super().reset()
+        for deducer in [self.value_deducer, self.single_candidate_deducer, self.companion_deducer, self.linebox_deducer, self.vertex_deducer]:
+            deducer.reset()
+        self.mark_all_dirty()
+    
     def _set_state(self, deducer:Deducers, enabled:bool, max_option=None):
         self._states[deducer] = [enabled, max_option]
     
@@ -82,26 +171,24 @@ class Deducer(_BaseDeducer):
     
     def deduce_adjacent(self, row:int, col:int):
         self._deduce_adjacent_values(row, col)
-        if len(self.transactions) > 0: return
+        if self.has_pending(): return
         self._deduce_adjacent_single_candidates(row, col)
-        if len(self.transactions) > 0: return
+        if self.has_pending(): return
         self._deduce_adjacent_lineboxes(row, col)
-        if len(self.transactions) > 0: return
+        if self.has_pending(): return
         self._deduce_adjacent_companions(row, col)
     
     def _deduce_adjacent_values(self, row:int, col:int):
         if not self._is_enabled(Deducers.VALUE_DEDUCER):
             return
-        self.deduce_value(self._get_row(row))
-        self.deduce_value(self._get_col(col))
-        self.deduce_value(self._get_box(row//3, col//3))
+        for unit in CELL_UNITS[row * 9 + col]:
+            self.deduce_value(self._cells.get_unit(unit))
     
     def _deduce_adjacent_single_candidates(self, row:int, col:int):
         if not self._is_enabled(Deducers.SINGLE_CANDIDATE_DEDUCER):
             return
-        self.deduce_single_candidate(self._get_row(row))
-        self.deduce_single_candidate(self._get_col(col))
-        self.deduce_single_candidate(self._get_box(row//3, col//3))
+        for unit in CELL_UNITS[row * 9 + col]:
+            self.deduce_single_candidate(self._cells.get_unit(unit))
     
     def _deduce_adjacent_lineboxes(self, row:int, col:int):
         if not self._is_enabled(Deducers.LINEBOX_DEDUCER):
@@ -112,9 +199,8 @@ class Deducer(_BaseDeducer):
     def _deduce_adjacent_companions(self, row:int, col:int):
         if not self._is_enabled(Deducers.COMPANION_DEDUCER):
             return
-        self.deduce_companion(self._get_row(row))
-        self.deduce_companion(self._get_col(col))
-        self.deduce_companion(self._get_box(row//3, col//3))
+        for unit in CELL_UNITS[row * 9 + col]:
+            self.deduce_companion(self._cells.get_unit(unit))
     
     def _deduce_adjacent_vertices(self, row:int, col:int):
         if not self._is_enabled(Deducers.VERTEX_DEDUCER):
@@ -123,109 +209,92 @@ class Deducer(_BaseDeducer):
         self.deduce_vertex(self._get_col(col))
     
     def deduce(self):
-        self._deduce_all_values()
-        if len(self.transactions) > 0: return
-        self._deduce_all_single_candidates()
-        if len(self.transactions) > 0: return
-        self._deduce_all_lineboxes()
-        if len(self.transactions) > 0: return
-        self._deduce_all_vertices()
-        if len(self.transactions) > 0: return
-        self._deduce_all_companions()
+        self.mark_all_dirty()
+        self.deduce_pending()
+    
+    def deduce_pending(self):
+        self._deduce_pending_values()
+        if self.has_pending(): return
+        self._deduce_pending_single_candidates()
+        if self.has_pending(): return
+        self._deduce_pending_lineboxes()
+        if self.has_pending(): return
+        self._deduce_pending_vertices()
+        if self.has_pending(): return
+        self._deduce_pending_companions()
     
     def eliminate(self):
-        self._clear_affected_cells()
-        self.value_deducer.eliminate()
-        self.single_candidate_deducer.eliminate()
-        self.linebox_deducer.eliminate()
-        self.companion_deducer.eliminate()
-        self.vertex_deducer.eliminate()
-        self._affected_cells.extend(self.value_deducer.affected_cells)
-        self._affected_cells.extend(self.single_candidate_deducer.affected_cells)
-        self._affected_cells.extend(self.linebox_deducer.affected_cells)
-        self._affected_cells.extend(self.companion_deducer.affected_cells)
-        self._affected_cells.extend(self.vertex_deducer.affected_cells)
-        self.clear_transactions()
+        super().eliminate()
+        self.mark_dirty(self._affected_cells)
+
+    def _count_pending_candidates(self) -> int:
+        # candidates the pending transactions will actually remove from the grid
+        transactions = self._transactions
+        masks = self._cells.grid.masks
+        count = 0
+        for index in transactions.touched:
+            count += mask_count(masks[index] & transactions.get_mask(index))
+        return count
 
-    def _get_all_rows(self) -> List[Cells]:
-        return [self._get_row(i) for i in range(9)]
-    
-    def _get_all_cols(self) -> List[Cells]:
-        return [self._get_col(i) for i in range(9)]
-    
-    def _get_all_boxes(self) -> List[Cells]:
-        return [self._get_box(i, j) for i in range(3) for j in range(3)]
-    
-    def _get_all_sliced_cells(self, include_boxes=True) -> List[Cells]:
-        cells_list = []
-        cells_list.extend(self._get_all_rows())
-        cells_list.extend(self._get_all_cols())
-        if include_boxes:
-            cells_list.extend(self._get_all_boxes())
-        return cells_list
-    
     def _get_row(self, row:int) -> Cells:
-        return self._cells[row]
+        return self._cells.get_row(row)
     
     def _get_col(self, col:int) -> Cells:
-        return self._cells[:, col]
+        return self._cells.get_col(col)
     
     def _get_box(self, boxrow:int, boxcol:int) -> Cells:
-        return self._cells[boxrow*3:boxrow*3+3,boxcol*3:boxcol*3+3]
+        return self._cells.get_box(boxrow, boxcol)
     
-    def _deduce_all_values(self):
-        if not self._is_enabled(Deducers.VALUE_DEDUCER):
-            return
-        cells_list = self._get_all_sliced_cells(include_boxes=True)
-        for cells in cells_list:
-            self.deduce_value(cells)
+    def _deduce_pending_values(self):
+        self._deduce_pending(Deducers.VALUE_DEDUCER, self.deduce_value)
     
-    def _deduce_all_single_candidates(self):
-        if not self._is_enabled(Deducers.SINGLE_CANDIDATE_DEDUCER):
-            return
-        cells_list = self._get_all_rows()
-        for cells in cells_list:
-            self.deduce_single_candidate(cells)
+    def _deduce_pending_single_candidates(self):
+        self._deduce_pending(Deducers.SINGLE_CANDIDATE_DEDUCER, self.deduce_single_candidate)
     
-    def _deduce_all_companions(self):
-        if not self._is_enabled(Deducers.COMPANION_DEDUCER):
-            return
-        cells_list = self._get_all_sliced_cells(include_boxes=True)
-        for cells in cells_list:
-            self.deduce_companion(cells)
+    def _deduce_pending_companions(self):
+        self._deduce_pending(Deducers.COMPANION_DEDUCER, self.deduce_companion)
 
-    def _deduce_all_lineboxes(self):
-        if not self._is_enabled(Deducers.LINEBOX_DEDUCER):
-            return
-        cells_list = self._get_all_sliced_cells(include_boxes=False)
-        for cells in cells_list:
-            self.deduce_linebox(cells)
+    def _deduce_pending_lineboxes(self):
+        self._deduce_pending(Deducers.LINEBOX_DEDUCER, self.deduce_linebox)
     
-    def _deduce_all_vertices(self):
-        if not self._is_enabled(Deducers.VERTEX_DEDUCER):
+    def _deduce_pending_vertices(self):
+        self._deduce_pending(Deducers.VERTEX_DEDUCER, self.deduce_vertex)
+    
+    def _deduce_pending(self, deducer:Deducers, deduce:Callable[[Cells], None]):
+        if not self._is_enabled(deducer):
+            return
+        units = self._pop_pending_units(deducer)
+        if self._stats is None:
+            for unit in units:
+                deduce(self._cells.get_unit(unit))
             return
-        cells_list = self._get_all_sliced_cells(include_boxes=False)
-        for cells in cells_list:
-            self.deduce_vertex(cells)
+        transaction_count = len(self._transactions)
+        candidate_count = self._count_pending_candidates()
+        time1 = perf_counter()
+        for unit in units:
+            deduce(self._cells.get_unit(unit))
+        time2 = perf_counter()
+        stats = self._stats[deducer]
+        stats.calls += len(units)
+        stats.time += time2 - time1
+        stats.transactions += len(self._transactions) - transaction_count
+        stats.eliminated += self._count_pending_candidates() - candidate_count
     
     def deduce_value(self, sliced_cells:Cells):
         if not self._is_enabled(Deducers.VALUE_DEDUCER):
             return
         self.value_deducer.deduce(sliced_cells)
-        self._transactions.extend_transactions(self.value_deducer._transactions)
     
     def deduce_single_candidate(self, sliced_cells:Cells):
         if not self._is_enabled(Deducers.SINGLE_CANDIDATE_DEDUCER):
             return
         self.single_candidate_deducer.deduce(sliced_cells)
-        self._transactions.extend_transactions(self.single_candidate_deducer._transactions)
     
     def deduce_companion(self, sliced_cells:Cells):
         if not self._is_enabled(Deducers.COMPANION_DEDUCER):
             return
         max_companion_length = self._states[Deducers.COMPANION_DEDUCER][1]
         self.companion_deducer.deduce(sliced_cells, max_companion_length)
-        self._transactions.extend_transactions(self.companion_deducer._transactions)
     
     def deduce_linebox(self, sliced_cells:Cells):
         if not self._is_enabled(Deducers.LINEBOX_DEDUCER):
@@ -233,7 +302,6 @@ class Deducer(_BaseDeducer):
         row, col = self._get_rowcol_from_sliced_cells(sliced_cells)
 
         self.linebox_deducer.deduce(row, col)
-        self._transactions.extend_transactions(self.linebox_deducer._transactions)
     
     def deduce_vertex(self, sliced_cells:Cells):
         if not self._is_enabled(Deducers.VERTEX_DEDUCER):
@@ -242,7 +310,6 @@ class Deducer(_BaseDeducer):
 
         max_vertex_pairs = self._states[Deducers.VERTEX_DEDUCER][1]
         self.vertex_deducer.deduce(row, col, max_vertex_pairs)
-        self._transactions.extend_transactions(self.vertex_deducer._transactions)
     
     def _get_rowcol_from_sliced_cells(self, sliced_cells:Cells):
         row_count = sliced_cells.row_count
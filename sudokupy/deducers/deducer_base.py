@@ -1,18 +1,22 @@
 import sys
 from pathlib import Path
 sys.path.append(Path(__file__).parent.parent.absolute())
-from sudokupy.cell import Cell, Cells
-from typing import Dict, Tuple, List, Union
+from sudokupy.cell import Cell, Cells, values_to_mask, mask_to_values
+from array import array
+from typing import List, Union
 
 class Transaction:
-    __slots__ = ['_cell', '_candidates', '_deducer_name']
-    def __init__(self, cell:Cell, deducer_name:str=None):
+    """
+    Candidates to remove from one cell, held as a candidate mask.
+    """
+    __slots__ = ['_cell', '_mask', '_deducer_name']
+    def __init__(self, cell:Cell, deducer_name:str=None, mask:int=0):
         self._cell = cell
-        self._candidates = []
+        self._mask = mask
         self._deducer_name = deducer_name
     
     def __repr__(self):
-        return f'<Transaction deducer:{self._deducer_name} cell:{self._cell.__repr__()} candidates:{self._candidates}>'
+        return f'<Transaction deducer:{self._deducer_name} cell:{self._cell.__repr__()} candidates:{self.candidates}>'
     
     @property
     def cell(self):
@@ -20,92 +24,102 @@ class Transaction:
     
     @property
     def candidates(self):
-        return self._candidates
+        return mask_to_values(self._mask)
+    
+    @property
+    def mask(self) -> int:
+        return self._mask
     
     @property
     def deducer_name(self):
         return self._deducer_name
     
     def add(self, candidates: List[int]):
-        if len(self._candidates) == 0:
-            self._candidates = candidates.copy()
-        else:
-            self._candidates.extend(candidates)
-            self._remove_duplicate_candidates()
-        self._candidates.sort()
-    
-    def _remove_duplicate_candidates(self):
-        candidates = list(set(self._candidates))
-        self._candidates = candidates
+        self._mask |= values_to_mask(candidates)
 
     def __eq__(self, other):
         return self._cell == other._cell
 
 class Transactions:
-    __slots__ = ['_transactions_dict', '_deducer_name']
+    """
+    Candidate masks to remove, one per cell, in the order cells were first added
+    """
+    __slots__ = ['_masks', '_cells', '_names', '_touched', '_deducer_name']
     def __init__(self, deducer_name:str=None):
         self._deducer_name = deducer_name
-        self._transactions_dict:Dict[Tuple[int], List[Transaction]] = {}
-        self.clear_transactions()
+        self._masks = array('H', [0]) * 81
+        self._cells: List[Cell] = [None] * 81
+        self._names: List[str] = [None] * 81
+        self._touched: List[int] = []
     
     def __str__(self):
-        return f'# of transactions:{len(self._transactions_dict)}\n' + '\n'.join(transaction.__repr__() for transaction in self.transactions)
+        return f'# of transactions:{len(self._touched)}\n' + '\n'.join(transaction.__repr__() for transaction in self.transactions)
 
     def __repr__(self):
         return f'<Transactions\n{self.__str__()}\n>'
     
     def __len__(self):
-        return len(self._transactions_dict)
+        return len(self._touched)
     
     @property
     def transactions(self) -> List[Transaction]:
         return self.get_transactions()
+    
+    @property
+    def touched(self) -> List[int]:
+        return self._touched
 
-    def add_transaction(self, cell:Cell, remove_candidates:Union[int, List[int]]):
-        position = self._get_position(cell)
-        if not self._cell_in_transactions(position):
-            self._make_new_transactions_entry(cell)
-        self._append_transaction(position, remove_candidates)
+    def add_transaction(self, cell:Cell, remove_candidates:Union[int, List[int]], deducer_name:str=None):
+        self.add_mask(cell, values_to_mask(remove_candidates), deducer_name)
+    
+    def add_mask(self, cell:Cell, mask:int, deducer_name:str=None):
+        index = cell.row * 9 + cell.column
+        if self._cells[index] is None:
+            self._cells[index] = cell
+            self._names[index] = deducer_name if deducer_name is not None else self._deducer_name
+            self._touched.append(index)
+        self._masks[index] |= mask
     
     def extend_transactions(self, other:'Transactions'):
-        other_transactions = other.transactions
-        for transaction in other_transactions:
-            self.add_transaction(transaction.cell, transaction.candidates)
+        masks = other._masks
+        cells = other._cells
+        names = other._names
+        for index in other._touched:
+            self.add_mask(cells[index], masks[index], names[index])
 
     def clear_transactions(self):
-        self._transactions_dict = {}
+        masks = self._masks
+        cells = self._cells
+        for index in self._touched:
+            masks[index] = 0
+            cells[index] = None
+        self._touched = []
+    
+    def get_cell(self, index:int) -> Cell:
+        return self._cells[index]
+    
+    def get_mask(self, index:int) -> int:
+        return self._masks[index]
+    
+    def get_deducer_name(self, index:int) -> str:
+        return self._names[index]
 
     def get_transactions(self) -> List[Transaction]:
-        return list(self._transactions_dict.values())
-
-    def _append_transaction(self, position:Tuple[int], remove_candidates:Union[int, List[int]]):
-        remove_candidates = self._validate_candidates(remove_candidates)
-        self._transactions_dict[position].add(remove_candidates)
-    
-    def _validate_candidates(self, candidates:Union[int, List[int]]) -> List[int]:
-        if type(candidates) is int:
-            candidates = [candidates]
-        return candidates
-    
-    def _make_new_transactions_entry(self, cell:Cell):
-        position = self._get_position(cell)
-        self._transactions_dict[position] = Transaction(cell, self._deducer_name)
-
-    def _cell_in_transactions(self, position:Tuple[int]) -> bool:
-        return position in self._transactions_dict.keys()
-    
-    def _get_position(self, cell:Cell) -> Tuple[int]:
-        return (cell.row, cell.column)
+        return [Transaction(self._cells[index], self._names[index], self._masks[index]) for index in self._touched]
     
 class _BaseDeducer:
     def __init__(self, deducer_name:str):
         self._affected_cells:List[Cell] = []
+        self._deducer_name = deducer_name
         self._transactions = Transactions(deducer_name)
     
     @property
     def transactions(self):
         return self._transactions.get_transactions()
     
+    def has_pending(self) -> bool:
+        return len(self._transactions) > 0
+    
     @property
     def affected_cells(self):
         return self._affected_cells
@@ -122,20 +136,28 @@ class _BaseDeducer:
 
     def eliminate(self):
         self._clear_affected_cells()
-        for transaction in self.transactions:
-            transaction.cell.remove_candidates(transaction.candidates)
-            self._add_affected_cell(transaction.cell)
+        transactions = self._transactions
+        affected_cells = self._affected_cells
+        for index in transactions.touched:
+            # touched indices are unique, so each cell is appended once
+            cell = transactions.get_cell(index)
+            cell.remove_candidate_mask(transactions.get_mask(index))
+            affected_cells.append(cell)
         self.clear_transactions()
 
     def _add_transaction(self, cell:Cell, remove_candidates:List[int]=None):
-        self._transactions.add_transaction(cell, remove_candidates)
+        self._transactions.add_transaction(cell, remove_candidates, self._deducer_name)
+
+    def _add_transaction_mask(self, cell:Cell, mask:int):
+        # the name travels with the mask, as the Deducer shares one Transactions across techniques
+        self._transactions.add_mask(cell, mask, self._deducer_name)
 
     def clear_transactions(self):
         self._transactions.clear_transactions()
 
-    def _add_affected_cell(self, cell:Cell):
-        if cell not in self._affected_cells:
-            self._affected_cells.append(cell)
+    def reset(self):
+        self.clear_transactions()
+        self._clear_affected_cells()
 
     def _clear_affected_cells(self):
         self._affected_cells = []
@@ -1,71 +1,11 @@
 import sys
 sys.path.append('../..')
-from sudokupy.cell import Cell, Cells
+from sudokupy.cell import Cells
 from sudokupy.deducers.deducer_base import _BaseDeducer 
-from typing import Dict, Optional, List
+from sudokupy.geometry import LINE_SEGMENTS, COL_UNIT_OFFSET
+from typing import List, Tuple
 
 class LineBoxDeducer(_BaseDeducer):
-    class _SegmentExclusiveCandidates:
-        def __init__(self, cells:Cells, row:Optional[int], col:Optional[int]):
-            line = self._get_line(cells, row, col)
-            self.exclusive_candidates = self._get_segment_exclusive_candidates(line)
-
-        def _get_line(self, cells:Cells, row:Optional[int], col:Optional[int]) -> Cells:
-            if row is not None:
-                line = cells[row]
-            elif col is not None:
-                line = cells[:, col]
-            else:
-                raise ValueError('must provide either row or col')
-            return line
-
-        def _get_segment_exclusive_candidates(self, line:Cells):
-            exclusive_candidates = []
-            counts = self._get_candidate_counts_by_segment(line)
-
-            for candidate, data in counts.items():
-                if data['count'] == 1:
-                    exclusive_candidates.append([candidate, data['segment_index']])
-            return exclusive_candidates
-        
-        def _get_candidate_counts_by_segment(self, line:Cells) -> Dict:
-            line_candidates = self._get_line_candidates(line)
-            segment_candidates = self._get_segmented_line_candidates(line)
-
-            counts = {}
-            for candidate in line_candidates:
-                counts[candidate] = {'count':0, 'segment_index':[]}
-                for segment_index, segment_candidate in enumerate(segment_candidates):
-                    if candidate in segment_candidate:
-                        counts[candidate]['count'] += 1
-                        counts[candidate]['segment_index'].append(segment_index)
-            return counts
-
-        def _get_line_candidates(self, line:Cells) -> List[int]:
-            candidate_set = []
-            candidates = line.get_candidates(flatten=True)
-            for candidate in candidates:
-                candidate_set.extend(candidate)
-            candidate_set = list(set(candidate_set))
-            return candidate_set
-        
-        def _get_segmented_line_candidates(self, line:Cells) -> List[List[int]]:
-            candidates = []
-            segmented_line = self._get_segmented_line(line)
-            for segment in segmented_line:
-                segment_candidates = []
-                for cell in segment:
-                    segment_candidates.extend(cell.candidates)
-                candidates.append(list(set(segment_candidates)))
-            return candidates
-        
-        def _get_segmented_line(self, line:Cells) -> List[List[Cell]]:
-            cells = line.flatten()
-            segmented_line = []
-            for i in [0, 3, 6]:
-                segmented_line.append(cells[i:i+3])
-            return segmented_line
-
     def __init__(self, cells:Cells):
         super().__init__('LineBoxDeducer')
         self._cells = cells
@@ -74,34 +14,41 @@ class LineBoxDeducer(_BaseDeducer):
         self._row = row
         self._col = col
 
-        segment_exclusive_candidates = self._SegmentExclusiveCandidates(self._cells, row, col).exclusive_candidates
-        boxes = self._get_boxes()
+        segments = LINE_SEGMENTS[self._get_line_unit(row, col)]
+        segment_masks = self._get_segment_masks(segments)
+        exclusive_mask = self._get_exclusive_mask(segment_masks)
 
-        for candidate, segment_index in segment_exclusive_candidates:
-            box = boxes[segment_index[0]]
-            for cell in box.flatten():
-                self._deduce_cell(cell, candidate)
-                
-    def _deduce_cell(self, cell:Cell, remove_candidate:int):
-        if cell.row == self._row or cell.column == self._col:
-            return
-        if remove_candidate in cell.candidates:
-            self._add_transaction(cell, remove_candidates=[remove_candidate])
+        for (box_unit, segment, remainder), segment_mask in zip(segments, segment_masks):
+            segment_exclusive_mask = exclusive_mask & segment_mask
+            if segment_exclusive_mask:
+                self._deduce_remainder(remainder, segment_exclusive_mask)
     
-    def _get_boxes(self) -> List[Cells]:
-        row = self._row
-        col = self._col
-        toplefts = [0, 3, 6]
+    def _get_line_unit(self, row:int=None, col:int=None) -> int:
         if row is not None:
-            rows = [(row//3)*3]
-            cols = toplefts
+            return row
         elif col is not None:
-            rows = toplefts
-            cols = [(col//3)*3]
-        
-        boxes = []
-        for r in rows:
-            for c in cols:
-                boxes.append(self._cells[r:r+3, c:c+3])
-        return boxes
-    
\ No newline at end of file
+            return COL_UNIT_OFFSET + col
+        else:
+            raise ValueError('must provide either row or col')
+    
+    def _get_segment_masks(self, segments:Tuple) -> List[int]:
+        masks = self._cells.grid.masks
+        segment_masks = []
+        for _, segment, _ in segments:
+            segment_mask = 0
+            for index in segment:
+                segment_mask |= masks[index]
+            segment_masks.append(segment_mask)
+        return segment_masks
+    
+    def _get_exclusive_mask(self, segment_masks:List[int]) -> int:
+        # candidates present in exactly one of the three segments
+        mask0, mask1, mask2 = segment_masks
+        return (mask0 ^ mask1 ^ mask2) & ~(mask0 & mask1 & mask2)
+    
+    def _deduce_remainder(self, remainder:Tuple[int, ...], remove_mask:int):
+        masks = self._cells.grid.masks
+        for index in remainder:
+            overlap = masks[index] & remove_mask
+            if overlap:
+                self._add_transaction_mask(self._cells.get_cell(index), overlap)
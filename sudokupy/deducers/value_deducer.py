@@ -1,6 +1,6 @@
 import sys
 sys.path.append('../..')
-from sudokupy.cell import Cells
+from sudokupy.cell import Cells, values_to_mask
 from sudokupy.deducers.deducer_base import _BaseDeducer 
 
 class ValueDeducer(_BaseDeducer):
@@ -13,17 +13,15 @@ class ValueDeducer(_BaseDeducer):
         self._validate_sliced_cells(sliced_cells)
         self._sliced_cells = sliced_cells
 
-        values = self._get_values(sliced_cells)
+        values_mask = values_to_mask(self._get_values(sliced_cells))
 
         for cell in sliced_cells.flatten():
-            candidates = cell.candidates
-            if len(candidates) > 0:
+            candidate_mask = cell.candidate_mask
+            if candidate_mask:
                 if cell.value != 0:
-                    self._add_transaction(cell, remove_candidates=candidates)
-                else:
-                    candidates = [candidate for candidate in candidates if candidate in values]
-                    if len(candidates) > 0:
-                        self._add_transaction(cell, remove_candidates=candidates)
+                    self._add_transaction_mask(cell, candidate_mask)
+                elif candidate_mask & values_mask:
+                    self._add_transaction_mask(cell, candidate_mask & values_mask)
     
     def _get_values(self, sliced_cells:Cells):
         values = sliced_cells.get_values(flatten=True)
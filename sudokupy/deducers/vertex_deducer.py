@@ -1,6 +1,7 @@
 import sys
 sys.path.append('../..')
 from sudokupy.cell import Cell, Cells
+from sudokupy.geometry import get_index
 from sudokupy.deducers.deducer_base import _BaseDeducer 
 from typing import List, Optional, Tuple
 
@@ -312,6 +313,10 @@ class VertexCoupleDeducer(_BaseDeducer):
         self._cells:Cells = cells
         self._vertices = VertexCouples()
         
+    def reset(self):
+        super().reset()
+        self._vertices = VertexCouples()
+        
     def deduce(self, row:int=None, col:int=None, max_vertex_pairs=3):
         flattened_sliced_cells = self._get_flattened_sliced_cells(row, col)
         pairs = self._find_pairs(flattened_sliced_cells)
@@ -339,7 +344,7 @@ class VertexCoupleDeducer(_BaseDeducer):
             cells = []
             for row in rows:
                 for col in cols:
-                    cell = self._cells.data[row][col]
+                    cell = self._cells.get_cell(get_index(row, col))
                     cells.append(cell)
             for valid_cell in valid_cell_list:
                 cells.remove(valid_cell)
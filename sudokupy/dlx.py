@@ -0,0 +1,221 @@
+import sys
+sys.path.append('..')
+from sudokupy.geometry import ROW_OF, COL_OF, BOX_OF
+from typing import Iterator, List, Optional, Sequence
+from time import perf_counter
+
+# Exact cover columns, numbered from 1 (0 is the root header):
+#   1-81    cell (row, col) is filled
+#   82-162  row contains digit
+#   163-243 column contains digit
+#   244-324 box contains digit
+_COLUMN_COUNT = 324
+_FIRST_NODE = _COLUMN_COUNT + 1
+_DEADLINE_CHECK_INTERVAL = 256 # search nodes between deadline checks
+
+def _get_row_columns(row:int) -> List[int]:
+    # exact cover row for placing digit (row % 9) + 1 in cell row // 9
+    index, digit = divmod(row, 9)
+    return [
+        1 + index,
+        82 + ROW_OF[index] * 9 + digit,
+        163 + COL_OF[index] * 9 + digit,
+        244 + BOX_OF[index] * 9 + digit,
+    ]
+
+def _make_template() -> tuple:
+    node_count = _FIRST_NODE + 729 * 4
+    left = list(range(-1, node_count - 1))
+    right = list(range(1, node_count + 1))
+    up = list(range(node_count))
+    down = list(range(node_count))
+    column = list(range(node_count))
+    sizes = [0] * _FIRST_NODE
+
+    left[0] = _COLUMN_COUNT
+    right[_COLUMN_COUNT] = 0
+
+    for row in range(729):
+        first = _FIRST_NODE + row * 4
+        for k, col in enumerate(_get_row_columns(row)):
+            node = first + k
+            left[node] = first + (k - 1) % 4
+            right[node] = first + (k + 1) % 4
+            column[node] = col
+            up[node] = up[col]
+            down[node] = col
+            down[up[col]] = node
+            up[col] = node
+            sizes[col] += 1
+    return (left, right, up, down, column, sizes)
+
+_TEMPLATE = _make_template()
+
+class DancingLinks:
+    """
+    Exact cover solver for a board given as 81 values, 0 for unfilled cells
+    """
+    def __init__(self, values:Sequence[int]):
+        values = list(values)
+        if len(values) != 81:
+            raise ValueError(f'values must have 81 elements (len={len(values)})')
+        for value in values:
+            if value not in range(0, 10):
+                raise ValueError('cell value must be an integer between 0 and 9')
+        self._values = values
+
+    def __repr__(self):
+        return f'<DancingLinks filled:{81 - self._values.count(0)}>'
+
+    def solve(self, timeout:float=None) -> Optional[List[int]]:
+        for solution in self.solutions(limit=1, timeout=timeout):
+            return solution
+        return None
+
+    def count_solutions(self, limit:int=None, timeout:float=None) -> int:
+        count = 0
+        for _ in self.solutions(limit, timeout):
+            count += 1
+        return count
+
+    def solutions(self, limit:int=None, timeout:float=None) -> Iterator[List[int]]:
+        if limit is not None and limit <= 0:
+            return
+        self._deadline = None if timeout is None else perf_counter() + timeout
+        self._deadline_countdown = 0
+        self._reset_links()
+        if not self._cover_givens():
+            return
+        count = 0
+        for rows in self._search([]):
+            yield self._make_solution(rows)
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+    def _reset_links(self):
+        left, right, up, down, column, sizes = _TEMPLATE
+        self._left = left[:]
+        self._right = right[:]
+        self._up = up[:]
+        self._down = down[:]
+        self._column = column
+        self._sizes = sizes[:]
+
+    def _cover_givens(self) -> bool:
+        covered = set()
+        for index, value in enumerate(self._values):
+            if value == 0:
+                continue
+            for col in _get_row_columns(index * 9 + value - 1):
+                if col in covered:
+                    return False
+                covered.add(col)
+                self._cover(col)
+        return True
+
+    def _make_solution(self, rows:List[int]) -> List[int]:
+        solution = self._values.copy()
+        for row in rows:
+            index, digit = divmod(row, 9)
+            solution[index] = digit + 1
+        return solution
+
+    def _search(self, rows:List[int]) -> Iterator[List[int]]:
+        right = self._right
+        left = self._left
+        down = self._down
+        sizes = self._sizes
+        column = self._column
+
+        if right[0] == 0:
+            yield rows
+            return
+
+        if self._deadline is not None:
+            self._check_deadline()
+
+        col = self._choose_column()
+        if sizes[col] == 0:
+            return
+
+        self._cover(col)
+        node = down[col]
+        while node != col:
+            rows.append((node - _FIRST_NODE) // 4)
+            other = right[node]
+            while other != node:
+                self._cover(column[other])
+                other = right[other]
+
+            yield from self._search(rows)
+
+            other = left[node]
+            while other != node:
+                self._uncover(column[other])
+                other = left[other]
+            rows.pop()
+            node = down[node]
+        self._uncover(col)
+
+    def _check_deadline(self):
+        if self._deadline_countdown > 0:
+            self._deadline_countdown -= 1
+            return
+        self._deadline_countdown = _DEADLINE_CHECK_INTERVAL
+        if perf_counter() > self._deadline:
+            raise TimeoutError('exact cover search not finished within timeout')
+
+    def _choose_column(self) -> int:
+        # column with the fewest remaining rows
+        right = self._right
+        sizes = self._sizes
+        col = right[0]
+        best = col
+        best_size = sizes[col]
+        while col != 0 and best_size > 1:
+            if sizes[col] < best_size:
+                best = col
+                best_size = sizes[col]
+            col = right[col]
+        return best
+
+    def _cover(self, col:int):
+        left = self._left
+        right = self._right
+        up = self._up
+        down = self._down
+        column = self._column
+        sizes = self._sizes
+
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+        row = down[col]
+        while row != col:
+            node = right[row]
+            while node != row:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                sizes[column[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def _uncover(self, col:int):
+        left = self._left
+        right = self._right
+        up = self._up
+        down = self._down
+        column = self._column
+        sizes = self._sizes
+
+        row = up[col]
+        while row != col:
+            node = left[row]
+            while node != row:
+                sizes[column[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row = up[row]
+        right[left[col]] = col
+        left[right[col]] = col
@@ -1,16 +1,20 @@
 import sys
 sys.path.append('..')
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Iterator, List
 from sudokupy.cell import Cells
-import tkinter
-from tkinter import filedialog
+from sudokupy.grid import Grid
+from sudokupy.store import PuzzleStore
 
 class _FileDialog:
+    """
+    Tk file dialogs, only used when no filename is given
+    """
     def __init__(self):
         self._init_root_tk()
 
     def _init_root_tk(self):
+        import tkinter
         root = tkinter.Tk()
         root.withdraw()
         root.lift()
@@ -19,14 +23,22 @@ class _FileDialog:
     
     @classmethod
     def askopenfilename(self):
+        from tkinter import filedialog
         result = filedialog.askopenfilename(title='Open CSV File', filetypes=[('CSV File', '*.csv')], initialdir='../boards')
         return result
     
     @classmethod
     def askdirectory(self):
+        from tkinter import filedialog
         result = filedialog.askdirectory(title='Choose Folder')
         return result
 
+# line format: 81 characters per puzzle, row by row, with '.' or '0' for unfilled cells
+_LINE_LENGTH = 81
+_LINE_DIGITS = b'0123456789'
+_LINE_TO_VALUES = bytes.maketrans(b'.' + _LINE_DIGITS, b'\x00' + bytes(range(10)))
+_VALUES_TO_LINE = {blank: bytes.maketrans(bytes(range(10)), blank.encode('ascii') + _LINE_DIGITS[1:]) for blank in ('.', '0')}
+
 class File:
     def __init__(self, folder:str=None):
         self.set_folder(folder)
@@ -50,6 +62,78 @@ class File:
         
         return csv_lines
 
+    def read_lines(self, filename:str) -> List[Cells]:
+        """
+        Reads puzzles in the 81-character line format, skipping blank and # lines
+        """
+        return list(self.iter_lines(filename))
+    
+    def iter_lines(self, filename:str, skip_invalid:bool=False, 
+            on_error:Callable[[int, str, ValueError], None]=None) -> Iterator[Cells]:
+        """
+        Lazily reads puzzles in the 81-character line format
+        """
+        path = self.get_path(filename)
+        self._validate_path(path)
+        with open(path, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if line == '' or line.startswith('#'):
+                    continue
+                try:
+                    values = self._parse_line(line, line_number)
+                except ValueError as error:
+                    if not skip_invalid:
+                        raise
+                    if on_error is not None:
+                        on_error(line_number, line, error)
+                    continue
+                yield self._make_line_cells(values)
+    
+    def to_lines(self, cells_list:Iterable[Cells], filename:str, blank:str='.') -> int:
+        """
+        Writes puzzles in the 81-character line format; returns the number written
+        """
+        if blank not in _VALUES_TO_LINE:
+            raise ValueError("blank must be '.' or '0'")
+        path = self.get_path(filename)
+        count = 0
+        with open(path, 'w') as f:
+            for cells in cells_list:
+                f.write(self._make_line(cells, blank) + '\n')
+                count += 1
+        return count
+    
+    def to_store(self, cells_list:Iterable[Cells], filename:str, cell_bits:int=4) -> int:
+        """
+        Writes puzzles to a PuzzleStore file; returns the number written
+        """
+        return PuzzleStore.write(self.get_path(filename), cells_list, cell_bits)
+    
+    def open_store(self, filename:str) -> PuzzleStore:
+        path = self.get_path(filename)
+        self._validate_path(path)
+        return PuzzleStore(path)
+    
+    def _parse_line(self, line:str, line_number:int=None) -> bytes:
+        raw = line.encode('ascii', errors='replace')
+        if len(raw) != _LINE_LENGTH:
+            raise ValueError(f'line {line_number}: expected {_LINE_LENGTH} characters (len={len(raw)})')
+        if raw.translate(None, b'.' + _LINE_DIGITS) != b'':
+            raise ValueError(f"line {line_number}: cells must be digits 1-9, or '.' or '0' when unfilled")
+        return raw.translate(_LINE_TO_VALUES)
+    
+    def _make_line(self, cells:Cells, blank:str='.') -> str:
+        values = cells.grid.values
+        if len(values) != _LINE_LENGTH:
+            raise ValueError(f'cells must have {_LINE_LENGTH} elements (len={len(values)})')
+        return bytes(values).translate(_VALUES_TO_LINE[blank]).decode('ascii')
+    
+    def _make_line_cells(self, values:bytes) -> Cells:
+        grid = Grid()
+        grid.set_values(values)
+        return Cells.from_grid(grid)
+
     def _make_csv_lines(self, cells:Cells) -> List[str]:
         lines = []
         for row in cells.data:
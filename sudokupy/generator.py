@@ -4,8 +4,11 @@ from sudokupy.board import Board
 from sudokupy.deducers.deducer import Deducer
 from sudokupy.injector import Injector
 from sudokupy.cell import Cell, Cells
+from sudokupy.dlx import DancingLinks
+from sudokupy.pool import map_in_pool
 import random
-from typing import List, Tuple
+import os
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 from enum import Enum
 
 class Difficulty(Enum):
@@ -16,29 +19,74 @@ class Difficulty(Enum):
     Evil=5
 
 def set_seed(seed:int=None):
+    # seeds the global random module; generators, removers and injectors use their own random.Random
     if seed is not None:
         random.seed(seed)
 
+def _generate_values(task:tuple) -> Tuple[int, bytes]:
+    # (index, seed, difficulty, unique, target_clues) -> (index, values)
+    index, seed, difficulty, unique, target_clues = task
+    board = Generator().generate(difficulty, seed, unique=unique, target_clues=target_clues)
+    return (index, bytes(board.grid.values))
+
 class Generator:
     def __init__(self, seed:int=None):
-        self.reset(seed)
+        self._random = random.Random(seed)
         self._board_generator:BoardGenerator=None
         self._remover:CellValuesRemover=None
         self.board:Board=None
     
     def reset(self, seed:int=None):
-        set_seed(seed)
-    
-    def generate(self, difficulty:Difficulty=Difficulty.Medium, seed:int=None) -> Board:
-        self._board_generator = BoardGenerator()
-        cells = self._board_generator.generate(seed)
-        self._remover = CellValuesRemover(cells, difficulty)
-        cells = self._remover.remove(seed)
-        board = Board()
-        board._cells = cells
+        if seed is not None:
+            self._random.seed(seed)
+    
+    def generate(self, difficulty:Difficulty=Difficulty.Medium, seed:int=None, 
+            unique:bool=False, target_clues:int=None) -> Board:
+        if seed is None:
+            seed = self._random.getrandbits(32)
+        self._board_generator = BoardGenerator(seed)
+        cells = self._board_generator.generate()
+        self._remover = CellValuesRemover(cells, difficulty, seed, unique=unique, target_clues=target_clues)
+        cells = self._remover.remove()
+        board = Board.from_cells(cells)
         self.board = board
         return board
     
+    def generate_batch(self, n:int, difficulty:Difficulty=Difficulty.Medium, seeds:Sequence[int]=None, 
+            workers:int=None, unique:bool=False, target_clues:int=None, 
+            chunksize:int=1, ordered:bool=True) -> Iterator[Union[Board, Tuple[int, Board]]]:
+        """
+        Generates n boards, each from its own seed, over a pool of worker processes
+        """
+        # validated here rather than on the first next(); ordered=False yields (seed index, board) pairs
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        seeds = self._get_batch_seeds(n, seeds)
+        tasks = [(index, seed, difficulty, unique, target_clues) for index, seed in enumerate(seeds)]
+        return self._generate_batch(tasks, workers, chunksize, ordered)
+    
+    def _generate_batch(self, tasks:List[tuple], workers:int, chunksize:int, 
+            ordered:bool) -> Iterator[Union[Board, Tuple[int, Board]]]:
+        if workers == 1 or len(tasks) <= 1:
+            results = map(_generate_values, tasks)
+        else:
+            results = map_in_pool(_generate_values, tasks, min(workers, len(tasks)), chunksize, ordered)
+        for index, values in results:
+            if ordered:
+                yield Board.from_values(values)
+            else:
+                yield (index, Board.from_values(values))
+    
+    def _get_batch_seeds(self, n:int, seeds:Sequence[int]=None) -> List[int]:
+        if seeds is None:
+            return [self._random.getrandbits(32) for _ in range(n)]
+        seeds = list(seeds)
+        if len(seeds) != n:
+            raise ValueError(f'seeds must have n elements ({len(seeds)} != {n})')
+        return seeds
+    
     def generate_easy(self, seed:int=None) -> Board:
         return self.generate(Difficulty.Easy, seed)
     def generate_medium(self, seed:int=None) -> Board:
@@ -56,10 +104,28 @@ class Generator:
         self.board.to_csv(filename, folder)
 
 class CellValuesRemover:
-    def __init__(self, cells:Cells, difficulty:Difficulty=Difficulty.Medium, seed:int=None):
+    """
+    Removes values from a solved board
+    """
+    def __init__(self, cells:Cells, difficulty:Difficulty=Difficulty.Medium, seed:int=None, 
+            unique:bool=False, target_clues:int=None):
         self._cells = cells
+        self._random = random.Random(seed)
         self.set_difficulty(difficulty)
-        self._reset(seed)
+        self.set_unique(unique)
+        self.set_target_clues(target_clues)
+    
+    def set_seed(self, seed:int=None):
+        if seed is not None:
+            self._random.seed(seed)
+    
+    def set_unique(self, unique:bool):
+        self._unique = unique
+    
+    def set_target_clues(self, target_clues:Optional[int]):
+        if target_clues is not None and target_clues not in range(0, 82):
+            raise ValueError('target_clues must be an integer between 0 and 81')
+        self._target_clues = target_clues
     
     def set_difficulty(self, difficulty:Difficulty):
         self._difficulty = difficulty
@@ -75,16 +141,35 @@ class CellValuesRemover:
         self.set_difficulty(Difficulty.Evil)
     
     def remove(self, seed:int=None) -> Cells:
-        set_seed(seed)
+        self.set_seed(seed)
         cells = self._cells.copy()
         cells.candidates = list(range(1, 10))
         filled_cells = self._get_filled_cells(cells)
-        removal_count = self._get_removal_count(self._difficulty)
+        if self._target_clues is None:
+            removal_count = self._get_removal_count(self._difficulty)
+        else:
+            removal_count = max(len(filled_cells) - self._target_clues, 0)
 
-        for _ in range(removal_count):
-            self._remove_cell(filled_cells)
+        if self._unique:
+            self._remove_unique_cells(cells, filled_cells, removal_count)
+        else:
+            for _ in range(removal_count):
+                self._remove_cell(filled_cells)
 
         return cells
+    
+    def _remove_unique_cells(self, cells:Cells, filled_cells:List[Cell], removal_count:int):
+        values = cells.get_values(flatten=True)
+        removed = 0
+        while removed < removal_count and len(filled_cells) > 0:
+            cell = self._get_removal_cell(filled_cells)
+            index = cell.index
+            values[index] = 0
+            if DancingLinks(values).count_solutions(limit=2) == 1:
+                cell.value = 0
+                removed += 1
+            else:
+                values[index] = cell.value
 
     def _get_filled_cells(self, cells:Cells):
         filled_cells = []
@@ -99,28 +184,26 @@ class CellValuesRemover:
         cell.value = 0
     
     def _get_removal_cell(self, filled_cells:List[Cell]) -> Cell:
-        cell = random.choice(filled_cells)
+        cell = self._random.choice(filled_cells)
         filled_cells.remove(cell)
         return cell
 
     def _get_removal_count(self, difficulty:Difficulty) -> int:
         if difficulty == Difficulty.Easy:
-            return random.choice(range(42, 46))
+            return self._random.choice(range(42, 46))
         elif difficulty == Difficulty.Medium:
-            return random.choice(range(48, 53))
+            return self._random.choice(range(48, 53))
         elif difficulty == Difficulty.Hard:
-            return random.choice(range(53, 57))
+            return self._random.choice(range(53, 57))
         elif difficulty == Difficulty.Expert:
-            return random.choice(range(57, 60))
+            return self._random.choice(range(57, 60))
         elif difficulty == Difficulty.Evil:
-            return random.choice(range(60, 64))
-
-    def _reset(self, seed:int=None):
-        set_seed(seed)
+            return self._random.choice(range(60, 64))
 
 class BoardGenerator:
     def __init__(self, seed:int=None):
-        self._reset(seed)
+        self._random = random.Random(seed)
+        self._reset()
     
     def __repr__(self):
         return f'<Board\n{self._board.cells}\n\n{self._board.cells.print_candidates()}\n>'
@@ -128,11 +211,15 @@ class BoardGenerator:
     def __str__(self):
         return f'{self._board.cells.print_candidates()}'
 
+    def set_seed(self, seed:int=None):
+        if seed is not None:
+            self._random.seed(seed)
+
     def _reset(self, seed:int=None):
+        self.set_seed(seed)
         self._board = Board()
         self._deducer = Deducer(self._board.cells)
-        self._injector = Injector(self._board.cells)
-        set_seed(seed)
+        self._injector = Injector(self._board.cells, seed=self._random.getrandbits(32))
     
     @property
     def cells(self):
@@ -147,8 +234,7 @@ class BoardGenerator:
         return self.cells
 
     def _is_board_complete(self) -> bool:
-        cells = self._board.cells.get_values(flatten=True)
-        if 0 in cells:
+        if 0 in self._board.grid.values:
             return False
         else:
             return True
@@ -161,19 +247,23 @@ class BoardGenerator:
         numbers = list(range(1, 10))
         random_numbers = []
         for _ in range(9):
-            num = random.choice(numbers)
+            num = self._random.choice(numbers)
             numbers.remove(num)
             random_numbers.append(num)
         return random_numbers
     
     def _deduce(self):
-        self._deducer.deduce()
-        while len(self._deducer.transactions) > 0:
+        self._deducer.deduce_pending()
+        while self._deducer.has_pending():
             self._deducer.eliminate()
-            self._deducer.deduce()
+            self._deducer.deduce_pending()
     
     def _inject(self):
         self._injector.inject()
+        if self._injector.rolled_back:
+            self._deducer.invalidate()
+        else:
+            self._deducer.mark_dirty(self._injector.affected_cells)
     
     def _get_next_unfilled_cell(self) -> Cell:
         # fill boxes clockwise starting from box[0, 1]
@@ -189,7 +279,7 @@ class BoardGenerator:
 
     def _get_random_unfilled_cell(self) -> Tuple[int, int]:
         while True:
-            x = random.randrange(9)
-            y = random.randrange(9)
+            x = self._random.randrange(9)
+            y = self._random.randrange(9)
             if self._board.cell[x, y].get_values(flatten=True) == [0]:
                 return (x, y)
@@ -0,0 +1,55 @@
+"""
+Precomputed index tables for the 9x9 board
+"""
+from typing import Tuple
+
+# cells are numbered row * 9 + column; units are rows 0-8, columns 9-17, boxes 18-26
+ROW_UNIT_OFFSET = 0
+COL_UNIT_OFFSET = 9
+BOX_UNIT_OFFSET = 18
+
+ROWS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(row * 9 + col for col in range(9)) for row in range(9))
+COLS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(row * 9 + col for row in range(9)) for col in range(9))
+BOXES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple((boxrow * 3 + row) * 9 + boxcol * 3 + col for row in range(3) for col in range(3))
+    for boxrow in range(3) for boxcol in range(3))
+UNITS: Tuple[Tuple[int, ...], ...] = ROWS + COLS + BOXES
+
+ROW_OF: Tuple[int, ...] = tuple(index // 9 for index in range(81))
+COL_OF: Tuple[int, ...] = tuple(index % 9 for index in range(81))
+BOX_OF: Tuple[int, ...] = tuple((index // 27) * 3 + (index % 9) // 3 for index in range(81))
+
+# (row unit, column unit, box unit) of every cell
+CELL_UNITS: Tuple[Tuple[int, int, int], ...] = tuple(
+    (ROW_UNIT_OFFSET + ROW_OF[index], COL_UNIT_OFFSET + COL_OF[index], BOX_UNIT_OFFSET + BOX_OF[index])
+    for index in range(81))
+
+# the 20 other cells sharing a row, column or box with every cell
+PEERS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sorted(set(UNITS[CELL_UNITS[index][0]] + UNITS[CELL_UNITS[index][1]] + UNITS[CELL_UNITS[index][2]]) - {index}))
+    for index in range(81))
+
+def _make_line_segments(line_unit:int) -> Tuple[Tuple[int, Tuple[int, ...], Tuple[int, ...]], ...]:
+    line = UNITS[line_unit]
+    segments = []
+    for start in (0, 3, 6):
+        segment = line[start:start+3]
+        box_unit = BOX_UNIT_OFFSET + BOX_OF[segment[0]]
+        remainder = tuple(index for index in UNITS[box_unit] if index not in segment)
+        segments.append((box_unit, segment, remainder))
+    return tuple(segments)
+
+# for each line unit (rows 0-8, columns 9-17): the 3 box intersections as
+# (box unit, cells shared by line and box, cells of the box outside the line)
+LINE_SEGMENTS = tuple(_make_line_segments(line_unit) for line_unit in range(18))
+
+def get_index(row:int, col:int) -> int:
+    return row * 9 + col
+
+def get_position(index:int) -> Tuple[int, int]:
+    return (index // 9, index % 9)
+
+def get_box_unit(boxrow:int, boxcol:int) -> int:
+    return BOX_UNIT_OFFSET + boxrow * 3 + boxcol
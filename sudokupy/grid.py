@@ -0,0 +1,140 @@
+from array import array
+from typing import List
+
+ALL_CANDIDATES_MASK = 0x1FF
+
+class Grid:
+    """
+    Flat storage for a board: one candidate mask, value and permanence flag per cell
+    """
+    __slots__ = ['_masks', '_values', '_permanent', '_views', '_trail']
+
+    def __init__(self, size:int=81):
+        self._masks = array('H', [ALL_CANDIDATES_MASK]) * size
+        self._values = bytearray(size)
+        self._permanent = bytearray(size)
+        self._views = None
+        self._trail = None
+
+    def __repr__(self):
+        return f'<Grid size:{len(self)}>'
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getstate__(self):
+        return (self._masks, self._values, self._permanent)
+
+    def __setstate__(self, state):
+        self._masks, self._values, self._permanent = state
+        self._views = None
+        self._trail = None
+
+    @property
+    def masks(self) -> array:
+        return self._masks
+
+    @property
+    def values(self) -> bytearray:
+        return self._values
+
+    @property
+    def permanent(self) -> bytearray:
+        return self._permanent
+
+    def copy(self) -> 'Grid':
+        grid = Grid.__new__(Grid)
+        grid._masks = self._masks[:]
+        grid._values = self._values[:]
+        grid._permanent = self._permanent[:]
+        grid._views = None
+        grid._trail = None
+        return grid
+
+    def copy_from(self, other:'Grid'):
+        if len(other) != len(self):
+            raise ValueError(f'grid sizes do not match ({len(other)} != {len(self)})')
+        if self._trail is not None:
+            self._record_all()
+        self._masks[:] = other._masks
+        self._values[:] = other._values
+        self._permanent[:] = other._permanent
+
+    def get_mask(self, index:int) -> int:
+        return self._masks[index]
+
+    def set_mask(self, index:int, mask:int):
+        if self._trail is not None:
+            self._record(index)
+        self._masks[index] = mask
+
+    def remove_mask(self, index:int, mask:int) -> bool:
+        old_mask = self._masks[index]
+        if old_mask & mask:
+            if self._trail is not None:
+                self._record(index)
+            self._masks[index] = old_mask & ~mask
+            return True
+        return False
+
+    def reset_masks(self):
+        if self._trail is not None:
+            self._record_all()
+        self._masks[:] = array('H', [ALL_CANDIDATES_MASK]) * len(self)
+
+    def get_value(self, index:int) -> int:
+        return self._values[index]
+
+    def set_value(self, index:int, value:int):
+        if self._trail is not None:
+            self._record(index)
+        self._values[index] = value
+
+    def set_values(self, values:List[int]):
+        if self._trail is not None:
+            self._record_all()
+        self._values[:] = bytes(values)
+
+    def is_permanent(self, index:int) -> bool:
+        return self._permanent[index] == 1
+
+    def set_permanent(self, index:int, is_permanent:bool):
+        self._permanent[index] = 1 if is_permanent else 0
+
+    @property
+    def is_trailing(self) -> bool:
+        return self._trail is not None
+
+    # while trailing, each write first records the cell's previous (index, mask, value)
+    def start_trail(self):
+        if self._trail is None:
+            self._trail = array('H')
+
+    def stop_trail(self):
+        self._trail = None
+
+    def get_trail_mark(self) -> int:
+        if self._trail is None:
+            raise ValueError('trail is not active')
+        return len(self._trail)
+
+    def undo_trail(self, mark:int):
+        trail = self._trail
+        if trail is None:
+            raise ValueError('trail is not active')
+        if mark > len(trail) or mark % 3 != 0:
+            raise ValueError(f'invalid trail mark {mark}')
+        masks = self._masks
+        values = self._values
+        for i in range(len(trail) - 3, mark - 1, -3):
+            index = trail[i]
+            masks[index] = trail[i + 1]
+            values[index] = trail[i + 2]
+        del trail[mark:]
+
+    def _record(self, index:int):
+        self._trail.extend((index, self._masks[index], self._values[index]))
+
+    def _record_all(self):
+        for index in range(len(self)):
+            self._record(index)
@@ -0,0 +1,89 @@
+from typing import Callable, Dict, List
+from enum import Enum
+
+class HookEvent(Enum):
+    DEDUCE_START = 0 # a deduce/eliminate pass begins; no arguments
+    DEDUCE_END = 1 # the pass ends with no transactions left; no arguments
+    ELIMINATE = 2 # transactions about to be eliminated: (transactions)
+    INJECTION_PUSH = 3 # a guess is pushed, or a popped guess is retried: (injection)
+    INJECTION_POP = 4 # a guess is rolled back: (injection)
+    SOLVE_END = 5 # solve() finished: (copy of the solved board), None when it raised
+
+class SolverHooks:
+    """
+    Base class for hook objects; only overridden on_* methods are registered
+    """
+    def on_deduce_start(self):
+        pass
+
+    def on_deduce_end(self):
+        pass
+
+    def on_eliminate(self, transactions):
+        pass
+
+    def on_injection_push(self, injection):
+        pass
+
+    def on_injection_pop(self, injection):
+        pass
+
+    def on_solve_end(self, board):
+        pass
+
+_HOOK_METHODS = {
+    HookEvent.DEDUCE_START: 'on_deduce_start',
+    HookEvent.DEDUCE_END: 'on_deduce_end',
+    HookEvent.ELIMINATE: 'on_eliminate',
+    HookEvent.INJECTION_PUSH: 'on_injection_push',
+    HookEvent.INJECTION_POP: 'on_injection_pop',
+    HookEvent.SOLVE_END: 'on_solve_end',
+}
+
+class Hooks:
+    """
+    Callbacks registered per HookEvent; falsy when empty
+    """
+    def __init__(self):
+        self._callbacks: Dict[HookEvent, List[Callable]] = {event: [] for event in HookEvent}
+        self._count = 0
+
+    def __repr__(self):
+        return f'<Hooks callbacks:{self._count}>'
+
+    def __bool__(self):
+        return self._count > 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, event:HookEvent, callback:Callable):
+        if not isinstance(event, HookEvent):
+            raise TypeError('event must be a HookEvent')
+        if not callable(callback):
+            raise TypeError('callback must be callable')
+        self._callbacks[event].append(callback)
+        self._count += 1
+
+    def add_hooks(self, hooks:SolverHooks):
+        if not isinstance(hooks, SolverHooks):
+            raise TypeError('hooks must be an instance of SolverHooks')
+        for event, name in _HOOK_METHODS.items():
+            if getattr(type(hooks), name) is not getattr(SolverHooks, name):
+                self.add(event, getattr(hooks, name))
+
+    def remove(self, event:HookEvent, callback:Callable):
+        self._callbacks[event].remove(callback)
+        self._count -= 1
+
+    def clear(self):
+        for callbacks in self._callbacks.values():
+            callbacks.clear()
+        self._count = 0
+
+    def has(self, event:HookEvent) -> bool:
+        return len(self._callbacks[event]) > 0
+
+    def fire(self, event:HookEvent, *args):
+        for callback in self._callbacks[event]:
+            callback(*args)
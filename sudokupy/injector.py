@@ -1,20 +1,41 @@
 import sys
 sys.path.append('..')
-from sudokupy.cell import Cells, Cell
-from typing import List, Dict
+from sudokupy.cell import Cells, Cell, mask_count
+from sudokupy.geometry import BOXES, PEERS
+from sudokupy.hooks import Hooks, HookEvent
+from typing import Callable, List, Dict, Optional, Union
+from enum import Enum
+from collections import deque
 import random
 
+class CellSelection(Enum):
+    BOX_ORDER = 0 # first unfilled cell, visiting boxes clockwise from box[0, 0]
+    MINIMUM_REMAINING_VALUES = 1 # unfilled cell with the fewest candidates; none if any has no candidates
+    MINIMUM_REMAINING_VALUES_DEGREE = 2 # fewest candidates, ties broken by most unfilled peers
+
+class HistoryMode(Enum):
+    OFF = 0 # nothing recorded
+    COUNTERS = 1 # push and pop counts only
+    BOUNDED = 2 # counts and the most recent history_size actions
+    FULL = 3 # counts and every action since the last reset
+
 class _Injection:
-    def __init__(self, cell:Cell, board_candidates:List[List[int]]):
+    def __init__(self, cell:Cell, trail_mark:int, rng:random.Random=None):
         self._cell = cell
+        self._random = rng if rng is not None else random.Random()
         self._available_candidates = cell.candidates
         self._untried_candidates = cell.candidates.copy()
-        self._board_candidates = board_candidates
+        self._trail_mark = trail_mark
+        self._propagated_cells: List[Cell] = []
     
     @property
     def cell(self) -> Cell:
         return self._cell
     
+    @property
+    def trail_mark(self) -> int:
+        return self._trail_mark
+    
     @property
     def untried_candidates(self) -> List[List[int]]:
         return self._untried_candidates
@@ -23,13 +44,17 @@ class _Injection:
     def available_candidates(self) -> List[List[int]]:
         return self._available_candidates
     
+    @property
+    def propagated_cells(self) -> List[Cell]:
+        return self._propagated_cells
+    
     def __repr__(self):
         return f'<InjectionCell value:{self._cell.value} available_candidates:{self._available_candidates} untried_candidates:{self._untried_candidates}>'
     
     def guess(self) -> int:
         if not self.has_untried_candidates():
             raise ValueError('No guesses left')
-        new_value = random.choice(self._untried_candidates)
+        new_value = self._random.choice(self._untried_candidates)
         self._untried_candidates.remove(new_value)
         self._value = new_value
         self._cell.value = new_value
@@ -39,29 +64,185 @@ class _Injection:
         return len(self._untried_candidates) > 0
 
 class Injector:
-    def __init__(self, cells:Cells):
+    """
+    Guesses values for unfilled cells and backtracks on dead ends
+    """
+    def __init__(self, cells:Cells, propagate:bool=False, 
+            cell_selection:Union[CellSelection, Callable[[Cells], Optional[Cell]]]=CellSelection.BOX_ORDER, 
+            seed:int=None, history_mode:HistoryMode=HistoryMode.COUNTERS, history_size:int=1000):
         self._cells = cells
+        self._random = random.Random(seed)
         self._injections: List[_Injection] = []
         self._popped = False
-        self._history = []
+        self.set_history_mode(history_mode, history_size)
+        self._affected_cells: List[Cell] = []
+        self._propagate = propagate
+        self._dead_end = False
+        self._hooks: Optional[Hooks] = None
+        self._cells.grid.start_trail()
+        self.set_cell_selection(cell_selection)
     
     @property
     def injections(self):
         return self._injections
     
-    def get_history(self):
-        return self._history
+    @property
+    def affected_cells(self) -> List[Cell]:
+        return self._affected_cells
+    
+    @property
+    def rolled_back(self) -> bool:
+        return self._popped
+    
+    def get_history(self) -> List[dict]:
+        if self._history is None:
+            return []
+        return list(self._history)
+    
+    @property
+    def history_mode(self) -> HistoryMode:
+        return self._history_mode
+    
+    @property
+    def push_count(self) -> int:
+        return self._push_count
+    
+    @property
+    def pop_count(self) -> int:
+        return self._pop_count
+    
+    def set_history_mode(self, history_mode:HistoryMode, history_size:int=1000):
+        if not isinstance(history_mode, HistoryMode):
+            raise TypeError('history_mode must be a HistoryMode')
+        if history_mode == HistoryMode.BOUNDED and history_size < 1:
+            raise ValueError('history_size must be at least 1')
+        self._history_mode = history_mode
+        self._history_size = history_size
+        self._reset_history()
+    
+    def _reset_history(self):
+        self._push_count = 0
+        self._pop_count = 0
+        if self._history_mode == HistoryMode.FULL:
+            self._history = []
+        elif self._history_mode == HistoryMode.BOUNDED:
+            self._history = deque(maxlen=self._history_size)
+        else:
+            self._history = None
+    
+    def _record_history(self, action:str, injection:_Injection):
+        if self._history_mode == HistoryMode.OFF:
+            return
+        if action == 'new':
+            self._push_count += 1
+        else:
+            self._pop_count += 1
+        if self._history is not None:
+            self._history.append({'action': action, 'injection': injection})
     
     def get_injections(self):
         return self._injections
     
+    @property
+    def propagate(self) -> bool:
+        return self._propagate
+    
+    @property
+    def dead_end(self) -> bool:
+        return self._dead_end
+    
+    def set_propagate(self, propagate:bool):
+        self._propagate = propagate
+    
+    @property
+    def hooks(self) -> Optional[Hooks]:
+        return self._hooks
+    
+    def set_hooks(self, hooks:Optional[Hooks]):
+        """
+        hooks receives INJECTION_PUSH and INJECTION_POP events with the injection.
+        """
+        self._hooks = hooks
+    
+    def set_seed(self, seed:int=None):
+        if seed is not None:
+            self._random.seed(seed)
+    
+    def reset(self):
+        self._injections = []
+        self._popped = False
+        self._reset_history()
+        self._affected_cells = []
+        self._dead_end = False
+        grid = self._cells.grid
+        grid.stop_trail()
+        grid.start_trail()
+    
+    @property
+    def cell_selection(self) -> Union[CellSelection, Callable[[Cells], Optional[Cell]]]:
+        return self._cell_selection
+    
+    def set_cell_selection(self, cell_selection:Union[CellSelection, Callable[[Cells], Optional[Cell]]]):
+        if cell_selection == CellSelection.BOX_ORDER:
+            self._select_cell = self._get_next_unfilled_cell_in_box_order
+        elif cell_selection == CellSelection.MINIMUM_REMAINING_VALUES:
+            self._select_cell = self._get_next_unfilled_cell_with_fewest_candidates
+        elif cell_selection == CellSelection.MINIMUM_REMAINING_VALUES_DEGREE:
+            self._select_cell = self._get_next_unfilled_cell_with_fewest_candidates_and_most_peers
+        elif callable(cell_selection):
+            self._select_cell = lambda: cell_selection(self._cells)
+        else:
+            raise TypeError('cell_selection must be a CellSelection or a callable')
+        self._cell_selection = cell_selection
+    
     def inject(self):
         injection = self._get_injection()
         injection.guess()
+        self._affected_cells = [injection.cell]
+        if self._propagate:
+            self._propagate_value(injection)
+    
+    def _propagate_value(self, injection:_Injection):
+        grid = self._cells.grid
+        masks = grid.masks
+        values = grid.values
+        set_mask = grid.set_mask
+        affected_indices = []
+        queue = [injection.cell.index]
+
+        while queue:
+            index = queue.pop()
+            value = values[index]
+            value_mask = 1 << (value - 1)
+            for peer in PEERS[index]:
+                if values[peer] == value:
+                    self._dead_end = True
+                    queue = []
+                    break
+                mask = masks[peer]
+                if not mask & value_mask:
+                    continue
+                mask &= ~value_mask
+                set_mask(peer, mask)
+                affected_indices.append(peer)
+                if values[peer] != 0:
+                    continue
+                if mask == 0:
+                    self._dead_end = True
+                    queue = []
+                    break
+                if not mask & (mask - 1):
+                    grid.set_value(peer, mask.bit_length())
+                    set_mask(peer, 0)
+                    injection.propagated_cells.append(self._cells.get_cell(peer))
+                    queue.append(peer)
+        
+        self._affected_cells.extend(self._cells.get_cell(index) for index in affected_indices)
     
     def _get_injection(self) -> _Injection:
         self._popped = False
-        injection = self._new_injection()
+        injection = None if self._dead_end else self._new_injection()
+        self._dead_end = False
         while injection is None:
             if len(self._injections) == 0:
                 raise ValueError('No Solution')
@@ -71,14 +252,17 @@ class Injector:
     
     def _rollback_candidates(self, injection:_Injection):
         if self._popped:
-            self._cells.candidates = injection._board_candidates
             self._append_injection(injection)
     
     def _pop_injection(self) -> _Injection:
         self._popped = True
         injection = self._injections.pop()
-        self._history.append({'action': 'pop', 'injection': injection})
-        injection.cell.value = 0
+        self._record_history('pop', injection)
+        if self._hooks:
+            self._hooks.fire(HookEvent.INJECTION_POP, injection)
+        # restores every mask and value changed since the injection was created
+        self._cells.grid.undo_trail(injection.trail_mark)
+        injection.propagated_cells.clear()
         if injection.has_untried_candidates():
             return injection
         else:
@@ -89,19 +273,20 @@ class Injector:
         if cell is None:
             return None
 
-        board_candidates = self._get_board_candidates()
-        injection = _Injection(cell, board_candidates)
+        injection = _Injection(cell, self._cells.grid.get_trail_mark(), self._random)
         self._append_injection(injection)
         return injection
     
     def _append_injection(self, injection:_Injection):
-        self._history.append({'action': 'new', 'injection': injection})
+        self._record_history('new', injection)
         self._injections.append(injection)
+        if self._hooks:
+            self._hooks.fire(HookEvent.INJECTION_PUSH, injection)
     
-    def _get_board_candidates(self) -> List[List[int]]:
-        return self._cells.get_candidates(flatten=True)
-
-    def _get_next_unfilled_cell(self) -> Cell:
+    def _get_next_unfilled_cell(self) -> Optional[Cell]:
+        return self._select_cell()
+    
+    def _get_next_unfilled_cell_in_box_order(self) -> Optional[Cell]:
         # fill boxes clockwise starting from box[0, 0]
         boxes = [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0), (1, 0), (1, 1)]
 
@@ -113,6 +298,58 @@ class Injector:
                         return cell
         return None
     
+    def _get_next_unfilled_cell_with_fewest_candidates(self) -> Optional[Cell]:
+        grid = self._cells.grid
+        masks = grid.masks
+        values = grid.values
+        best_index = None
+        best_count = 10
+        for index in range(81):
+            if values[index] != 0:
+                continue
+            mask = masks[index]
+            if mask == 0:
+                # an unfilled cell without candidates is a dead end; fail first
+                return None
+            count = mask_count(mask)
+            if count < best_count:
+                best_index = index
+                best_count = count
+                if count == 1:
+                    break
+        if best_index is None:
+            return None
+        return self._cells.get_cell(best_index)
+    
+    def _get_next_unfilled_cell_with_fewest_candidates_and_most_peers(self) -> Optional[Cell]:
+        grid = self._cells.grid
+        masks = grid.masks
+        values = grid.values
+        best_index = None
+        best_count = 10
+        best_degree = -1
+        for index in range(81):
+            if values[index] != 0:
+                continue
+            mask = masks[index]
+            if mask == 0:
+                # an unfilled cell without candidates is a dead end; fail first
+                return None
+            count = mask_count(mask)
+            if count > best_count:
+                continue
+            if count == 1:
+                # a single candidate leaves nothing to branch on
+                best_index = index
+                break
+            degree = sum(1 for peer in PEERS[index] if values[peer] == 0)
+            if count < best_count or degree > best_degree:
+                best_index = index
+                best_count = count
+                best_degree = degree
+        if best_index is None:
+            return None
+        return self._cells.get_cell(best_index)
+    
     def _get_cells_in_box(self, boxrow:int, boxcol:int) -> List[Cell]:
-        box = self._cells[boxrow*3:boxrow*3+3, boxcol*3:boxcol*3+3]
-        return box.flatten()
\ No newline at end of file
+        return [self._cells.get_cell(index) for index in BOXES[boxrow * 3 + boxcol]]
\ No newline at end of file
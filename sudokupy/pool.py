@@ -0,0 +1,17 @@
+import sys
+sys.path.append('..')
+from typing import Any, Callable, Iterable, Iterator
+
+def map_in_pool(func:Callable[[Any], Any], tasks:Iterable, workers:int, chunksize:int=1, ordered:bool=True,
+        initializer:Callable=None, initargs:tuple=()) -> Iterator:
+    """
+    Maps func over tasks in a pool of worker processes, in task order or as results finish
+    """
+    # imported here so that importing sudokupy never loads multiprocessing;
+    # tasks and results should be small tuples of ints and bytes, which pickle cheaply
+    from multiprocessing import Pool
+    with Pool(workers, initializer=initializer, initargs=initargs) as pool:
+        if ordered:
+            yield from pool.imap(func, tasks, chunksize)
+        else:
+            yield from pool.imap_unordered(func, tasks, chunksize)
@@ -1,21 +1,49 @@
 import sys
 sys.path.append('..')
 from sudokupy.board import Board
-from sudokupy.deducers.deducer import Deducer
-from sudokupy.injector import Injector
+from sudokupy.deducers.deducer import Deducer, Deducers, DeducerStats
+from sudokupy.injector import Injector, CellSelection
 from sudokupy.cell import Cell, Cells
 from sudokupy.deducers.deducer_base import Transaction
 from sudokupy.injector import _Injection
+from sudokupy.dlx import DancingLinks
+from sudokupy.hooks import Hooks, HookEvent, SolverHooks
 from sudokupy.file import File
-from typing import List
+from sudokupy.pool import map_in_pool
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
+from enum import Enum
+from time import perf_counter
+
+class Engine(Enum):
+    DEDUCTION = 0 # deducers and guesses, as a human would solve
+    DANCING_LINKS = 1 # exact cover search
+
+_worker_solver:'Solver' = None
+
+def _init_worker_solver(engine:Engine):
+    # one solver per worker process, reused for all of its tasks
+    global _worker_solver
+    _worker_solver = Solver(engine=engine)
+
+def _solve_values(task:Tuple[int, bytes, Optional[float]]) -> Tuple[int, Optional[bytes]]:
+    # (index, values, timeout) -> (index, solved values, or None when unsolved)
+    index, values, timeout = task
+    for solved_board in _worker_solver.solve_many([Board.from_values(values)], timeout=timeout):
+        if solved_board is None:
+            return (index, None)
+        return (index, bytes(solved_board.grid.values))
 
 class Solver:
-    def __init__(self, board:Board=None, csv_filename:str=None):
+    def __init__(self, board:Board=None, csv_filename:str=None, engine:Engine=Engine.DEDUCTION, seed:int=None):
         self._unsolved_board:Board = None
         self._solved_board:Board = None
         self._deducer:Deducer = None
         self._injector:Injector = None
+        self._engine = engine
+        self._seed = seed
+        self._collect_stats = False
+        self._hooks = Hooks()
 
         if board is not None:
             self.from_board(board)
@@ -29,6 +57,44 @@ class Solver:
     def unsolved_board(self) -> Board:
         return self._unsolved_board
     
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+    
+    def set_engine(self, engine:Engine):
+        self._engine = engine
+    
+    def set_seed(self, seed:int=None):
+        self._seed = seed
+        if self._injector is not None:
+            self._injector.set_seed(seed)
+    
+    @property
+    def hooks(self) -> Hooks:
+        return self._hooks
+    
+    def add_hooks(self, hooks:SolverHooks):
+        self._hooks.add_hooks(hooks)
+    
+    def add_callback(self, event:HookEvent, callback:Callable):
+        self._hooks.add(event, callback)
+    
+    @property
+    def stats(self) -> Optional[Dict[Deducers, DeducerStats]]:
+        if self._deducer is None:
+            return None
+        return self._deducer.stats
+    
+    def enable_stats(self):
+        self._collect_stats = True
+        if self._deducer is not None:
+            self._deducer.enable_stats()
+    
+    def disable_stats(self):
+        self._collect_stats = False
+        if self._deducer is not None:
+            self._deducer.disable_stats()
+    
     @property
     def transactions(self) -> List[Transaction]:
         return self._deducer.transactions
@@ -49,36 +115,161 @@ class Solver:
         self.from_board(board)
     
     def from_board(self, board:Board):
-        if not isinstance(board, Board):
-            raise TypeError('board must be an instance of Board')
+        self._validate_board(board)
         self._unsolved_board = board.copy()
         self._solved_board = board.copy()
         self._deducer = Deducer(self._solved_board.cells)
-        self._injector = Injector(self._solved_board.cells)
+        if self._collect_stats:
+            self._deducer.enable_stats()
+        self._injector = Injector(self._solved_board.cells, propagate=True, 
+            cell_selection=CellSelection.MINIMUM_REMAINING_VALUES_DEGREE, seed=self._seed)
+        self._injector.set_hooks(self._hooks)
     
-    def solve(self) -> Board:
+    def _validate_board(self, board:Board):
+        if not isinstance(board, Board):
+            raise TypeError('board must be an instance of Board')
+    
+    def _as_board(self, board:Union[Board, Cells]) -> Board:
+        if isinstance(board, Cells):
+            return Board.from_cells(board)
+        self._validate_board(board)
+        return board
+    
+    def _load_board(self, board:Board):
+        # reuses the grids, deducer and injector of the previous board when there is one
+        if self._deducer is None:
+            self.from_board(board)
+            return
+        # the injector restarts the trail, so copying the new board need not be recorded
+        self._solved_board.grid.stop_trail()
+        self._unsolved_board.grid.copy_from(board.grid)
+        self._solved_board.grid.copy_from(board.grid)
+        self._injector.reset()
+        self._deducer.reset()
+    
+    def solve(self, timeout:float=None) -> Board:
+        """
+        Raises ValueError if the board has no solution, TimeoutError past timeout seconds
+        """
+        if not self._hooks.has(HookEvent.SOLVE_END):
+            return self._solve(timeout)
+        try:
+            board = self._solve(timeout)
+        except (ValueError, TimeoutError):
+            self._hooks.fire(HookEvent.SOLVE_END, None)
+            raise
+        # a copy, as solve_many() reuses the working board for the next board
+        self._hooks.fire(HookEvent.SOLVE_END, board.copy())
+        return board
+    
+    def _solve(self, timeout:float=None) -> Board:
+        if self._engine == Engine.DANCING_LINKS:
+            return self._solve_dancing_links(timeout)
+        deadline = None if timeout is None else perf_counter() + timeout
         while not self._is_board_solved():
+            if deadline is not None and perf_counter() > deadline:
+                raise TimeoutError(f'board not solved within {timeout} seconds')
             self._deduce()
             self._inject()
         return self._solved_board
     
+    def solve_many(self, boards:Iterable[Union[Board, Cells]], workers:int=1, chunksize:int=1, 
+            ordered:bool=True, timeout:float=None) -> Iterator[Union[Optional[Board], Tuple[int, Optional[Board]]]]:
+        """
+        Yields a solved copy of each board, or None if unsolvable or timed out
+        """
+        # ordered=False yields (input index, board) pairs as they finish; hooks and stats only see workers=1
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        return self._solve_many(boards, workers, chunksize, ordered, timeout)
+    
+    def _solve_many(self, boards:Iterable[Union[Board, Cells]], workers:int, chunksize:int, 
+            ordered:bool, timeout:float=None) -> Iterator[Union[Optional[Board], Tuple[int, Optional[Board]]]]:
+        if workers == 1:
+            results = self._solve_many_inline(boards, timeout)
+        else:
+            results = self._solve_many_in_pool(boards, workers, chunksize, ordered, timeout)
+        for index, solved_board in results:
+            if ordered:
+                yield solved_board
+            else:
+                yield (index, solved_board)
+    
+    def _solve_many_inline(self, boards:Iterable[Board], timeout:float=None) -> Iterator[Tuple[int, Optional[Board]]]:
+        for index, board in enumerate(boards):
+            self._load_board(self._as_board(board))
+            try:
+                solved_board = self.solve(timeout)
+            except (ValueError, TimeoutError):
+                yield (index, None)
+                continue
+            yield (index, solved_board.copy())
+    
+    def _solve_many_in_pool(self, boards:Iterable[Board], workers:int, chunksize:int, 
+            ordered:bool, timeout:float=None) -> Iterator[Tuple[int, Optional[Board]]]:
+        tasks = ((index, self._encode_board(board), timeout) for index, board in enumerate(boards))
+        results = map_in_pool(_solve_values, tasks, workers, chunksize, ordered, 
+            initializer=_init_worker_solver, initargs=(self._engine,))
+        for index, values in results:
+            if values is None:
+                yield (index, None)
+            else:
+                yield (index, self._make_solved_board(Board(), values))
+    
+    def _encode_board(self, board:Union[Board, Cells]) -> bytes:
+        return bytes(self._as_board(board).grid.values)
+    
+    def solutions(self, limit:int=None) -> Iterator[Board]:
+        values = self._unsolved_board.cells.get_values(flatten=True)
+        for solution in DancingLinks(values).solutions(limit):
+            yield self._make_solved_board(self._unsolved_board.copy(), solution)
+    
+    def count_solutions(self, limit:int=2) -> int:
+        """
+        Counts solutions of the unsolved board up to limit (None for all)
+        """
+        values = self._unsolved_board.cells.get_values(flatten=True)
+        return DancingLinks(values).count_solutions(limit)
+    
+    def _solve_dancing_links(self, timeout:float=None) -> Board:
+        values = self._unsolved_board.cells.get_values(flatten=True)
+        solution = DancingLinks(values).solve(timeout)
+        if solution is None:
+            raise ValueError('No Solution')
+        return self._make_solved_board(self._solved_board, solution)
+    
+    def _make_solved_board(self, board:Board, solution:List[int]) -> Board:
+        board.grid.set_values(solution)
+        board.cells.set_candidates([])
+        return board
+    
     def to_csv(self, filename:str, folder:str=None) -> Path:
         if self._solved_board is None:
             return
         self._solved_board.to_csv(filename, folder)
     
     def _is_board_solved(self) -> bool:
-        cells = self._solved_board.cells.get_values(flatten=True)
-        if 0 in cells:
+        if 0 in self._solved_board.grid.values or self._injector.dead_end:
             return False
         else:
             return True
     
     def _deduce(self):
-        self._deducer.deduce()
-        while len(self._deducer.transactions) > 0:
+        hooks = self._hooks
+        if hooks:
+            hooks.fire(HookEvent.DEDUCE_START)
+        self._deducer.deduce_pending()
+        while self._deducer.has_pending():
+            if hooks:
+                hooks.fire(HookEvent.ELIMINATE, self._deducer.transactions)
             self._deducer.eliminate()
-            self._deducer.deduce()
+            self._deducer.deduce_pending()
+        if hooks:
+            hooks.fire(HookEvent.DEDUCE_END)
     
     def _inject(self):
         self._injector.inject()
+        if self._injector.rolled_back:
+            self._deducer.invalidate()
+        else:
+            self._deducer.mark_dirty(self._injector.affected_cells)
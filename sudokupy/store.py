@@ -0,0 +1,133 @@
+import sys
+sys.path.append('..')
+from sudokupy.cell import Cells
+from sudokupy.grid import Grid
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+import mmap
+import struct
+
+# header: magic, format version, bits per cell, 2 padding bytes, puzzle count
+_HEADER = struct.Struct('<4sBBxxQ')
+_MAGIC = b'SDKP'
+_VERSION = 1
+_CELL_COUNT = 81
+_RECORD_SIZES = {4: (_CELL_COUNT + 1) // 2, 8: _CELL_COUNT}
+
+# 4-bit records hold two cells per byte, the first cell in the high nibble
+_HIGH_NIBBLE = bytes(byte >> 4 for byte in range(256))
+_LOW_NIBBLE = bytes(byte & 0x0F for byte in range(256))
+_TO_HIGH_NIBBLE = bytes((byte << 4) & 0xFF for byte in range(256))
+
+def _pack_values(values:bytes, cell_bits:int) -> bytes:
+    if cell_bits == 8:
+        return values
+    values = values + b'\x00'
+    high = values[0::2].translate(_TO_HIGH_NIBBLE)
+    low = values[1::2]
+    packed = int.from_bytes(high, 'big') | int.from_bytes(low, 'big')
+    return packed.to_bytes(_RECORD_SIZES[4], 'big')
+
+def _unpack_values(record:bytes, cell_bits:int) -> bytes:
+    if cell_bits == 8:
+        return record
+    values = bytearray(_CELL_COUNT + 1)
+    values[0::2] = record.translate(_HIGH_NIBBLE)
+    values[1::2] = record.translate(_LOW_NIBBLE)
+    return bytes(values[:_CELL_COUNT])
+
+class PuzzleStore:
+    """
+    Read-only, memory-mapped file of packed puzzles
+    """
+    def __init__(self, path:Union[str, Path]):
+        self._path = Path(path)
+        self._file = open(self._path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_header()
+        except (ValueError, OSError):
+            self.close()
+            raise
+
+    def __repr__(self):
+        return f'<PuzzleStore {self._path.name} puzzles:{self._count} cell_bits:{self._cell_bits}>'
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index:int) -> Cells:
+        # copies the puzzle; get_values() is a view into the mapped file for 8-bit stores
+        grid = Grid()
+        grid.set_values(self.get_values(index))
+        return Cells.from_grid(grid)
+
+    def __iter__(self) -> Iterator[Cells]:
+        for index in range(self._count):
+            yield self[index]
+
+    def __enter__(self) -> 'PuzzleStore':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def cell_bits(self) -> int:
+        return self._cell_bits
+
+    def get_values(self, index:int) -> Union[bytes, memoryview]:
+        # for 8-bit stores, a view that must be released before close()
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f'puzzle index out of range (count={self._count})')
+        start = _HEADER.size + index * self._record_size
+        if self._cell_bits == 8:
+            return memoryview(self._mmap)[start:start + self._record_size]
+        return _unpack_values(self._mmap[start:start + self._record_size], self._cell_bits)
+
+    def close(self):
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def _read_header(self):
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f'{self._path} is not a puzzle store')
+        magic, version, cell_bits, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError(f'{self._path} is not a puzzle store')
+        if version != _VERSION:
+            raise ValueError(f'unsupported puzzle store version {version}')
+        if cell_bits not in _RECORD_SIZES:
+            raise ValueError(f'unsupported cell size {cell_bits}')
+        record_size = _RECORD_SIZES[cell_bits]
+        if len(self._mmap) < _HEADER.size + count * record_size:
+            raise ValueError(f'{self._path} is truncated')
+        self._cell_bits = cell_bits
+        self._record_size = record_size
+        self._count = count
+
+    @classmethod
+    def write(cls, path:Union[str, Path], cells_list:Iterable[Cells], cell_bits:int=4) -> int:
+        """
+        Writes an iterable of Cells or Boards to path; returns the number of puzzles written.
+        """
+        if cell_bits not in _RECORD_SIZES:
+            raise ValueError('cell_bits must be 4 or 8')
+        count = 0
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, cell_bits, 0))
+            for cells in cells_list:
+                values = bytes(cells.grid.values)
+                if len(values) != _CELL_COUNT:
+                    raise ValueError(f'cells must have {_CELL_COUNT} elements (len={len(values)})')
+                if max(values) > 9:
+                    raise ValueError('cell value must be an integer between 0 and 9')
+                f.write(_pack_values(values, cell_bits))
+                count += 1
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, _VERSION, cell_bits, count))
+        return count
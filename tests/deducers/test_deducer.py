@@ -143,6 +143,41 @@ class TestDeducer:
         d.deduce_value(board.box[0, 0])
         assert len(d.transactions) == 9
     
+    def test_has_pending(self):
+        board = Board()
+        d = Deducer(board.cells)
+        assert d.has_pending() == False
+        board.cell[0, 0].values = 5
+        d.deduce_value(board.box[0, 0])
+        d.deduce_value(board.row[0])
+        assert d.has_pending() == True
+        assert d.value_deducer._transactions is d._transactions
+        # (0,0), (0,1) and (0,2) lie in both units and are merged into one transaction each
+        assert len(d.transactions) == 9 + 6
+        d.eliminate()
+        assert d.has_pending() == False
+        assert 5 not in board.cell[0, 1].candidates
+        assert 5 not in board.cell[1, 1].candidates
+
+    def test_transaction_deducer_names(self):
+        board = Board('easy01.csv')
+        d = Deducer(board.cells)
+        d.deduce()
+        assert len(d.transactions) > 0
+        assert {t.deducer_name for t in d.transactions} == {'ValueDeducer'}
+
+        board = Board()
+        d = Deducer(board.cells)
+        board.cell[0, 0].candidates = [1, 3]
+        board.cell[1, 1].candidates = [3, 5]
+        board.cell[2, 2].candidates = [1, 5]
+        board.cell[8, 8].values = 9
+        d.deduce_value(board.box[2, 2])
+        d.deduce_companion(board.box[0, 0])
+        names = {t.cell.index: t.deducer_name for t in d.transactions}
+        assert names[80] == 'ValueDeducer'
+        assert names[1] == 'CompanionDeducer'
+
     def test_deduce_companion(self):
         board = Board()
         d = Deducer(board.cells)
@@ -228,3 +263,105 @@ class TestDeducer:
         assert sum([1, 3, 5] == x.candidates for x in d.transactions) == 4
         assert sum([3, 5, 8] == x.candidates for x in d.transactions) == 4
         assert sum([1, 3, 5, 8] == x.candidates for x in d.transactions) == 2
+
+    def test_techniques(self):
+        assert list(Deducer.TECHNIQUES) == list(Deducers)
+        assert list(Deducer.TECHNIQUES[Deducers.LINEBOX_DEDUCER]) == list(range(18))
+        with pytest.raises(TypeError):
+            Deducer.TECHNIQUES[Deducers.VALUE_DEDUCER] = range(9)
+
+    def test_pending_units(self):
+        board = Board()
+        d = Deducer(board.cells)
+        assert d._pending_units[Deducers.VALUE_DEDUCER] == set(range(27))
+
+        board.cell[0, 0].values = 5
+        board.cell[0, 0].candidates = []
+        d.deduce_pending()
+        assert d._pending_units[Deducers.VALUE_DEDUCER] == set()
+        assert len(d._pending_units[Deducers.COMPANION_DEDUCER]) == 27
+
+        d.eliminate()
+        # every row and column, but only the boxes along row 0 and column 0
+        assert d._pending_units[Deducers.VALUE_DEDUCER] == set(range(18)) | {18, 19, 20, 21, 24}
+        assert d._pending_units[Deducers.LINEBOX_DEDUCER] == set(range(18))
+
+        d.deduce_pending()
+        assert len(d.transactions) == 0
+        for pending_units in d._pending_units.values():
+            assert pending_units == set()
+
+    def test_mark_dirty(self):
+        board = Board()
+        d = Deducer(board.cells)
+        d.deduce()
+        assert len(d.transactions) == 0
+
+        board.cell[4, 4].values = 5
+        d.deduce_pending()
+        assert len(d.transactions) == 0
+
+        d.mark_dirty([board.cells.get_cell(40)])
+        assert d._pending_units[Deducers.VALUE_DEDUCER] == {4, 13, 22}
+        assert d._pending_units[Deducers.SINGLE_CANDIDATE_DEDUCER] == {4}
+        assert d._pending_units[Deducers.VERTEX_DEDUCER] == {4, 13}
+        d.deduce_pending()
+        assert len(d.transactions) == 9 + 6 + 6 # box, row, col
+
+    def test_deduce_scans_outside_edits(self):
+        board = Board()
+        d = Deducer(board.cells)
+        d.deduce()
+        assert len(d.transactions) == 0
+
+        # edits made directly on the board are found without mark_dirty
+        board.cell[4, 4].values = 5
+        d.deduce()
+        assert len(d.transactions) == 9 + 6 + 6 # box, row, col
+
+    def test_invalidate(self):
+        board = Board()
+        d = Deducer(board.cells)
+        board.cell[0, 0].candidates = [1]
+        d.deduce()
+        assert len(d.transactions) > 0
+        assert len(d.single_candidate_deducer._checked_cells) == 1
+
+        d.invalidate()
+        assert len(d.transactions) == 0
+        assert len(d.single_candidate_deducer._checked_cells) == 0
+        assert d._pending_units[Deducers.VALUE_DEDUCER] == set(range(27))
+
+    def test_stats(self):
+        board = Board()
+        d = Deducer(board.cells)
+        assert d.stats is None
+        d.enable_stats()
+        board.cell[0, 0].values = 5
+        board.cell[0, 0].candidates = []
+        d.deduce()
+        d.eliminate()
+        stats = d.stats[Deducers.VALUE_DEDUCER]
+        assert stats.calls == 27
+        assert stats.transactions == 20
+        assert stats.eliminated == 20
+        assert d.stats[Deducers.LINEBOX_DEDUCER].calls == 0
+
+        d.reset()
+        assert d.stats[Deducers.VALUE_DEDUCER].calls == 27
+        d.reset_stats()
+        assert d.stats[Deducers.VALUE_DEDUCER].calls == 0
+
+    def test_reset(self):
+        board = Board()
+        d = Deducer(board.cells)
+        board.cell[0, 0].candidates = [1]
+        d.deduce()
+        assert len(d.transactions) > 0
+        d._pop_pending_units(Deducers.LINEBOX_DEDUCER)
+
+        d.reset()
+        assert len(d.transactions) == 0
+        assert d.affected_cells == []
+        assert len(d.single_candidate_deducer._checked_cells) == 0
+        assert d._pending_units[Deducers.LINEBOX_DEDUCER] == set(range(18))
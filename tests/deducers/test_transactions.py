@@ -114,4 +114,28 @@ class TestTransactions:
         t.add_transaction(Cell(0, 0, 0), [1, 2])
         result = t.get_transactions()
         assert type(result) is list
-        assert len(result) == 1
\ No newline at end of file
+        assert len(result) == 1
+
+    def test_add_mask(self):
+        t = Transactions()
+        cell = Cell(2, 3, 0)
+        t.add_mask(cell, 0b101)
+        t.add_transaction(Cell(2, 3, 0), [2])
+        assert t.touched == [21]
+        assert t.get_mask(21) == 0b111
+        assert t.get_cell(21) is cell
+        assert t.transactions[0].candidates == [1, 2, 3]
+        assert t.transactions[0].mask == 0b111
+
+        t.clear_transactions()
+        assert t.touched == []
+        assert t.get_mask(21) == 0
+        assert t.get_cell(21) is None
+
+    def test_add_mask_deducer_name(self):
+        t = Transactions('Deducer')
+        t.add_mask(Cell(0, 1, 0), 0b1, 'ValueDeducer')
+        t.add_mask(Cell(0, 1, 0), 0b10, 'CompanionDeducer')
+        t.add_mask(Cell(0, 2, 0), 0b1)
+        assert t.get_deducer_name(1) == 'ValueDeducer'
+        assert [transaction.deducer_name for transaction in t.transactions] == ['ValueDeducer', 'Deducer']
@@ -0,0 +1,31 @@
+import sys
+sys.path.append('..')
+from sudokupy.benchmarks.suite import summarize, bench_file, bench_deducers, run
+from sudokupy.solver import Engine
+import json
+import pytest
+
+class TestBenchmarkSuite:
+    def test_summarize(self):
+        summary = summarize([3.0, 1.0, 2.0])
+        assert summary['count'] == 3
+        assert summary['min'] == 1.0
+        assert summary['median'] == 2.0
+        assert summary['max'] == 3.0
+
+    def test_bench_file(self):
+        results = bench_file(warmups=0, repetitions=1, puzzle_count=20)
+        assert set(results) == {'read_csv', 'iter_lines', 'store'}
+        assert results['store']['puzzles_per_second'] > 0
+
+    def test_bench_deducers(self):
+        results = bench_deducers(warmups=0, repetitions=1)
+        assert 'COMPANION_DEDUCER' in results
+
+    def test_run(self, tmpdir):
+        output = tmpdir / 'results.json'
+        report = run(['solve'], warmups=0, repetitions=1, engine=Engine.DANCING_LINKS, output=str(output))
+        assert json.loads(output.read_text('utf-8')) == report
+        assert report['results']['solve']['evil']['boards'] == 2
+        with pytest.raises(ValueError):
+            run(['unknown'])
@@ -167,6 +167,15 @@ class TestBoard:
         cells = file.read_csv('to_csv.csv')
 
         assert cells == b.cells
+    
+    def test_from_values(self):
+        b = Board('easy01.csv')
+        values = b.cells.get_values(flatten=True)
+        result = Board.from_values(values)
+        assert result.row[0].get_values(flatten=True) == [7, 0, 4, 9, 0, 0, 5, 6, 8]
+        assert result.cells.get_values(flatten=True) == values
 
-
-
+        with pytest.raises(ValueError):
+            Board.from_values([0] * 80)
+        with pytest.raises(ValueError):
+            Board.from_values([10] + [0] * 80)
@@ -1,6 +1,6 @@
 import sys
 sys.path.append('..')
-from sudokupy.cell import Cell, Cells, Candidate
+from sudokupy.cell import Cell, Cells, Candidate, values_to_mask, mask_to_values, mask_count
 import pytest
 
 class TestCandidate:
@@ -67,6 +67,59 @@ class TestCandidate:
         c.set([2,3])
         assert c.count() == 2
 
+    def test_mask(self):
+        c = Candidate()
+        assert c.mask == 0b111111111
+        c.set([1, 3])
+        assert c.mask == 0b101
+        c.remove_mask(0b1)
+        assert c.values == [3]
+        c.set_mask(0b110000000)
+        assert c.values == [8, 9]
+
+        with pytest.raises(ValueError):
+            c.set_mask(512)
+        with pytest.raises(ValueError):
+            Candidate(-1)
+
+    def test_iter_contains(self):
+        c = Candidate()
+        c.set([2, 5, 7])
+        assert list(c) == [2, 5, 7]
+        assert len(c) == 3
+        assert 5 in c
+        assert 4 not in c
+        assert 0 not in c
+
+    def test_and_or(self):
+        c1 = Candidate()
+        c1.set([1, 2, 3])
+        c2 = Candidate()
+        c2.set([3, 4])
+        assert (c1 & c2).values == [3]
+        assert (c1 | c2).values == [1, 2, 3, 4]
+        assert (c1 & 0b110).values == [2, 3]
+        assert c1.values == [1, 2, 3]
+
+    def test_eq_hash(self):
+        c1 = Candidate()
+        c1.set([1, 2])
+        c2 = Candidate()
+        c2.set([1, 2])
+        assert c1 == c2
+        assert hash(c1) == hash(c2)
+        assert len({c1, c2, Candidate()}) == 2
+
+    def test_values_to_mask(self):
+        assert values_to_mask([]) == 0
+        assert values_to_mask(1) == 0b1
+        assert values_to_mask([9, 1]) == 0b100000001
+        assert mask_to_values(0b100000001) == [1, 9]
+        assert mask_count(0b100000001) == 2
+
+        with pytest.raises(ValueError):
+            values_to_mask(0)
+
 class TestCell:
     def test_constructor(self):
         c = Cell(0, 1, 2)
@@ -132,6 +185,13 @@ class TestCell:
         with pytest.raises(ValueError):
             c.remove_candidates('2')
     
+    def test_candidate_mask(self):
+        c = Cell(0, 0, 0)
+        assert c.candidate_mask == 0b111111111
+        c.remove_candidate_mask(0b11)
+        assert c.candidates == [3, 4, 5, 6, 7, 8, 9]
+        assert c.candidate_mask == 0b111111100
+
     def test_reset_candidates(self):
         c = Cell(0, 0, 0)
         assert len(c.candidates) == 9
@@ -503,6 +563,14 @@ class TestCells:
             with pytest.raises(ValueError):
                 Cells(invalid_input)
     
+    def test_constructor_standalone_cells(self):
+        c = Cells([[Cell(4, 5, 3), Cell(4, 6)]])
+        assert c.topleft_row == 4
+        assert c.topleft_column == 5
+        assert c.get_values() == [[3, 0]]
+        assert [cell.row for cell in c.flatten()] == [4, 4]
+        assert [cell.column for cell in c.flatten()] == [5, 6]
+    
     def test_print_candidates(self):
         c = Cells()
         s = c.print_candidates()
@@ -548,7 +616,24 @@ class TestCells:
         
         assert cells2[0, 0].as_cell().value == 0
         assert cells2[0, 0].as_cell().candidates == list(range(1, 10))
-        
-
-
     
+    def test_unit_views(self):
+        c = Cells()
+        assert c[2] is c[2]
+        assert c[:, 4] is c[:, 4]
+        assert c[3:6, 6:9] is c[3:6, 6:9]
+        assert c[2] is c.get_row(2)
+        assert c[:, 4] is c.get_col(4)
+        assert c[3:6, 6:9] is c.get_box(1, 2)
+
+        assert c.get_col(4).topleft_column == 4
+        assert c.get_col(4).row_count == 9
+        assert c.get_box(1, 2).topleft_row == 3
+        assert c.get_box(1, 2).topleft_column == 6
+        assert c.get_box(1, 2).col_count == 3
+
+        assert c[3:6, 5:8] is not c[3:6, 5:8]
+        assert c[3:6, 5:8].topleft_column == 5
+
+        with pytest.raises(ValueError):
+            c[2].get_row(0)
@@ -0,0 +1,68 @@
+import sys
+sys.path.append('..')
+from sudokupy.dlx import DancingLinks
+from sudokupy.file import File
+import pytest
+
+def _is_valid_solution(values, solution):
+    rows = [solution[i*9:i*9+9] for i in range(9)]
+    cols = [solution[i::9] for i in range(9)]
+    boxes = [[solution[(r+br*3)*9 + c+bc*3] for r in range(3) for c in range(3)] for br in range(3) for bc in range(3)]
+    for unit in rows + cols + boxes:
+        if sorted(unit) != list(range(1, 10)):
+            return False
+    return all(v == 0 or v == s for v, s in zip(values, solution))
+
+class TestDancingLinks:
+    @pytest.mark.parametrize('filename', ['easy01.csv', 'hard01.csv', 'evil01.csv', 'evil02.csv'])
+    def test_solve(self, filename):
+        values = File().read_csv(filename).get_values(flatten=True)
+        solution = DancingLinks(values).solve()
+        assert _is_valid_solution(values, solution)
+
+    def test_count_solutions(self):
+        values = File().read_csv('easy01.csv').get_values(flatten=True)
+        d = DancingLinks(values)
+        assert d.count_solutions() == 1
+        assert d.count_solutions(limit=2) == 1
+
+        d = DancingLinks([0] * 81)
+        assert d.count_solutions(limit=5) == 5
+        assert d.count_solutions(limit=0) == 0
+
+    def test_solutions(self):
+        values = File().read_csv('easy01.csv').get_values(flatten=True)
+        values[0] = 0
+        values[2] = 0
+        solutions = list(DancingLinks(values).solutions(limit=10))
+        assert len(solutions) >= 1
+        for solution in solutions:
+            assert _is_valid_solution(values, solution)
+        assert len(set(tuple(solution) for solution in solutions)) == len(solutions)
+
+    def test_no_solution(self):
+        values = [0] * 81
+        values[0] = 1
+        values[1] = 1
+        d = DancingLinks(values)
+        assert d.solve() is None
+        assert d.count_solutions() == 0
+
+        values = [0] * 81
+        values[0:8] = [1, 2, 3, 4, 5, 6, 7, 8]
+        values[17] = 9
+        assert DancingLinks(values).solve() is None
+
+    def test_timeout(self):
+        d = DancingLinks([0] * 81)
+        with pytest.raises(TimeoutError):
+            d.solve(timeout=0)
+        with pytest.raises(TimeoutError):
+            d.count_solutions(timeout=0.01)
+        assert _is_valid_solution([0] * 81, d.solve(timeout=60))
+
+    def test_invalid_values(self):
+        with pytest.raises(ValueError):
+            DancingLinks([0] * 80)
+        with pytest.raises(ValueError):
+            DancingLinks([10] + [0] * 80)
@@ -39,3 +39,65 @@ class TestFile:
         assert cells == cells2
 
 
+
+    def test_to_lines_read_lines(self, tmpdir):
+        file = File()
+        easy = file.read_csv('easy01.csv')
+        hard = file.read_csv('hard01.csv')
+
+        file = File(tmpdir)
+        assert file.to_lines([easy, hard], 'puzzles.txt') == 2
+        lines = file.get_path('puzzles.txt').read_text().splitlines()
+        assert lines[0][:9] == '7.49..568'
+        assert len(lines[1]) == 81
+
+        cells_list = file.read_lines('puzzles.txt')
+        assert [bytes(cells.grid.values) for cells in cells_list] == [bytes(easy.grid.values), bytes(hard.grid.values)]
+
+        file.to_lines([easy], 'zeros.txt', blank='0')
+        assert file.get_path('zeros.txt').read_text()[:9] == '704900568'
+        assert [bytes(cells.grid.values) for cells in file.read_lines('zeros.txt')] == [bytes(easy.grid.values)]
+
+    def test_read_lines_skips_comments(self, tmpdir):
+        file = File(tmpdir)
+        file.get_path('puzzles.txt').write_text('# header\n\n' + '.' * 81 + '\n')
+        cells_list = file.read_lines('puzzles.txt')
+        assert len(cells_list) == 1
+        assert bytes(cells_list[0].grid.values) == bytes(81)
+
+    @pytest.mark.parametrize('line', ['.' * 80, '.' * 82, 'x' + '.' * 80, '-1' + '.' * 79])
+    def test_read_lines_invalid(self, tmpdir, line):
+        file = File(tmpdir)
+        file.get_path('puzzles.txt').write_text(line + '\n')
+        with pytest.raises(ValueError):
+            file.read_lines('puzzles.txt')
+
+    def test_to_lines_invalid_blank(self, tmpdir):
+        file = File(tmpdir)
+        with pytest.raises(ValueError):
+            file.to_lines([Cells()], 'puzzles.txt', blank='_')
+
+    def test_iter_lines(self, tmpdir):
+        file = File(tmpdir)
+        file.get_path('puzzles.txt').write_text('.' * 80 + '9\n' + '.' * 80 + '\n' + '1' + '.' * 80 + '\n')
+        cells_iter = file.iter_lines('puzzles.txt')
+        assert bytes(next(cells_iter).grid.values) == bytes(80) + b'\x09'
+        with pytest.raises(ValueError):
+            next(cells_iter)
+
+        errors = []
+        cells_list = list(file.iter_lines('puzzles.txt', skip_invalid=True, 
+            on_error=lambda line_number, line, error: errors.append((line_number, line))))
+        assert len(cells_list) == 2
+        assert bytes(cells_list[1].grid.values) == b'\x01' + bytes(80)
+        assert errors == [(2, '.' * 80)]
+
+        assert len(list(file.iter_lines('puzzles.txt', skip_invalid=True))) == 2
+
+    def test_tkinter_not_imported(self):
+        import subprocess
+        from pathlib import Path
+        script = "import sys; import sudokupy.solver; print('tkinter' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', script], cwd=Path(__file__).parent.parent,
+            capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'False'
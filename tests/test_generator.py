@@ -0,0 +1,87 @@
+import sys
+sys.path.append('..')
+from sudokupy.generator import Generator, CellValuesRemover, BoardGenerator, Difficulty
+from sudokupy.dlx import DancingLinks
+import pytest
+
+class TestCellValuesRemover:
+    def test_remove_unique(self):
+        cells = BoardGenerator().generate(seed=1)
+        remover = CellValuesRemover(cells, Difficulty.Evil, unique=True)
+        removed = remover.remove(seed=1)
+        values = removed.get_values(flatten=True)
+        assert DancingLinks(values).count_solutions(limit=2) == 1
+        assert cells.get_values(flatten=True).count(0) == 0
+
+    def test_remove_target_clues(self):
+        cells = BoardGenerator().generate(seed=2)
+        remover = CellValuesRemover(cells, unique=True, target_clues=30)
+        values = remover.remove(seed=2).get_values(flatten=True)
+        assert 81 - values.count(0) == 30
+        assert DancingLinks(values).count_solutions(limit=2) == 1
+
+    def test_remove_target_clues_without_unique(self):
+        cells = BoardGenerator().generate(seed=3)
+        remover = CellValuesRemover(cells, target_clues=20)
+        values = remover.remove(seed=3).get_values(flatten=True)
+        assert 81 - values.count(0) == 20
+
+    def test_set_target_clues_invalid(self):
+        cells = BoardGenerator().generate(seed=4)
+        with pytest.raises(ValueError):
+            CellValuesRemover(cells, target_clues=82)
+
+class TestGenerator:
+    def test_generate_unique(self):
+        board = Generator().generate(Difficulty.Hard, seed=5, unique=True)
+        values = board.cells.get_values(flatten=True)
+        assert DancingLinks(values).count_solutions(limit=2) == 1
+        assert board.row[0].get_values(flatten=True) == values[:9]
+
+    def test_generate_batch(self):
+        seeds = [11, 12, 13]
+        expected = [Generator().generate(Difficulty.Easy, seed).grid.values for seed in seeds]
+        boards = list(Generator().generate_batch(3, Difficulty.Easy, seeds=seeds, workers=2, ordered=True))
+        assert [board.grid.values for board in boards] == expected
+        assert boards[0].row[0].get_values(flatten=True) == list(expected[0][:9])
+
+    def test_generate_batch_inline(self):
+        boards = list(Generator().generate_batch(2, Difficulty.Easy, workers=1))
+        assert len(boards) == 2
+        assert boards[0].grid.values != boards[1].grid.values
+
+    def test_generate_batch_unordered(self):
+        seeds = [11, 12]
+        expected = [Generator().generate(Difficulty.Easy, seed).grid.values for seed in seeds]
+        results = list(Generator().generate_batch(2, Difficulty.Easy, seeds=seeds, workers=2, ordered=False))
+        assert sorted(index for index, _ in results) == [0, 1]
+        for index, board in results:
+            assert board.grid.values == expected[index]
+
+    def test_generate_batch_invalid(self):
+        # raised at the call, before the batch is iterated
+        with pytest.raises(ValueError):
+            Generator().generate_batch(2, seeds=[1])
+        with pytest.raises(ValueError):
+            Generator().generate_batch(2, workers=0)
+
+    def test_generate_reproducible(self):
+        first = Generator(seed=7).generate(Difficulty.Easy).grid.values
+        generator = Generator(seed=7)
+        assert generator.generate(Difficulty.Easy).grid.values == first
+        assert generator.generate(Difficulty.Easy).grid.values != first
+
+    def test_generate_in_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        seeds = [21, 22]
+        expected = [Generator().generate(Difficulty.Easy, seed).grid.values for seed in seeds]
+        with ThreadPoolExecutor(2) as executor:
+            boards = list(executor.map(lambda seed: Generator().generate(Difficulty.Easy, seed), seeds))
+        assert [board.grid.values for board in boards] == expected
+
+    def test_generate_does_not_use_global_random(self):
+        import random
+        random.seed(0)
+        state = random.getstate()
+        Generator(seed=1).generate(Difficulty.Easy)
+        assert random.getstate() == state
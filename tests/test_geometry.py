@@ -0,0 +1,43 @@
+import sys
+sys.path.append('..')
+from sudokupy import geometry
+from sudokupy.geometry import UNITS, ROWS, COLS, BOXES, PEERS, CELL_UNITS, LINE_SEGMENTS
+
+class TestGeometry:
+    def test_units(self):
+        assert len(UNITS) == 27
+        for unit in UNITS:
+            assert len(unit) == 9
+        assert ROWS[1] == tuple(range(9, 18))
+        assert COLS[2] == tuple(range(2, 81, 9))
+        assert BOXES[4] == (30, 31, 32, 39, 40, 41, 48, 49, 50)
+
+    def test_cell_units(self):
+        assert CELL_UNITS[0] == (0, 9, 18)
+        assert CELL_UNITS[80] == (8, 17, 26)
+        for index in range(81):
+            for unit in CELL_UNITS[index]:
+                assert index in UNITS[unit]
+
+    def test_peers(self):
+        for index in range(81):
+            assert len(PEERS[index]) == 20
+            assert index not in PEERS[index]
+        assert PEERS[0][:8] == (1, 2, 3, 4, 5, 6, 7, 8)
+
+    def test_line_segments(self):
+        assert len(LINE_SEGMENTS) == 18
+        box_unit, segment, remainder = LINE_SEGMENTS[4][1]
+        assert box_unit == 22
+        assert segment == (39, 40, 41)
+        assert remainder == (30, 31, 32, 48, 49, 50)
+
+        box_unit, segment, remainder = LINE_SEGMENTS[9][2]
+        assert box_unit == 24
+        assert segment == (54, 63, 72)
+        assert len(remainder) == 6
+
+    def test_positions(self):
+        assert geometry.get_index(4, 5) == 41
+        assert geometry.get_position(41) == (4, 5)
+        assert geometry.get_box_unit(2, 1) == 25
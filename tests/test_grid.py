@@ -0,0 +1,119 @@
+import sys
+sys.path.append('..')
+from sudokupy.grid import Grid, ALL_CANDIDATES_MASK
+from sudokupy.cell import Cells
+from sudokupy.board import Board
+import pickle
+import pytest
+
+class TestGrid:
+    def test_constructor(self):
+        g = Grid()
+        assert len(g) == 81
+        assert all(mask == ALL_CANDIDATES_MASK for mask in g.masks)
+        assert g.values == bytearray(81)
+
+        g2 = Grid(1)
+        assert len(g2) == 1
+
+    def test_masks(self):
+        g = Grid()
+        g.set_mask(3, 0b101)
+        assert g.get_mask(3) == 0b101
+        assert g.remove_mask(3, 0b1) == True
+        assert g.get_mask(3) == 0b100
+        assert g.remove_mask(3, 0b1) == False
+
+        g.reset_masks()
+        assert g.get_mask(3) == ALL_CANDIDATES_MASK
+
+    def test_copy(self):
+        g1 = Grid()
+        g1.set_value(0, 5)
+        g1.set_mask(0, 0)
+        g1.set_permanent(0, True)
+        g2 = g1.copy()
+        assert g2.get_value(0) == 5
+        assert g2.get_mask(0) == 0
+        assert g2.is_permanent(0) == True
+
+        g1.set_value(0, 6)
+        assert g2.get_value(0) == 5
+
+    def test_copy_from(self):
+        g1 = Grid()
+        g2 = Grid()
+        g1.set_value(10, 4)
+        g2.copy_from(g1)
+        assert g2.get_value(10) == 4
+
+        with pytest.raises(ValueError):
+            g2.copy_from(Grid(1))
+
+    def test_pickle(self):
+        g = Grid()
+        g.set_value(2, 9)
+        g2 = pickle.loads(pickle.dumps(g))
+        assert g2.get_value(2) == 9
+        assert g2.masks == g.masks
+
+    def test_cells_share_grid(self):
+        cells = Cells()
+        grid = cells.grid
+        cells[1, 2].values = 7
+        assert grid.get_value(11) == 7
+        cells.data[1][2].candidates = [3]
+        assert grid.get_mask(11) == 0b100
+        assert cells[1].grid is grid
+
+    def test_board_from_grid(self):
+        g = Grid()
+        g.set_value(80, 9)
+        b = Board.from_grid(g)
+        assert b.grid is g
+        assert b.cell[8, 8].values == [[9]]
+
+        with pytest.raises(ValueError):
+            Board.from_grid(Grid(1))
+
+    def test_trail(self):
+        g = Grid()
+        assert g.is_trailing == False
+        with pytest.raises(ValueError):
+            g.get_trail_mark()
+
+        g.start_trail()
+        assert g.is_trailing == True
+        g.set_mask(0, 0b1)
+        mark = g.get_trail_mark()
+        assert mark == 3
+
+        g.set_value(5, 3)
+        g.remove_mask(5, 0b100)
+        g.remove_mask(6, 0)
+        g.set_mask(0, 0)
+        assert g.get_trail_mark() == 12
+
+        g.undo_trail(mark)
+        assert g.get_trail_mark() == mark
+        assert g.get_value(5) == 0
+        assert g.get_mask(5) == ALL_CANDIDATES_MASK
+        assert g.get_mask(0) == 0b1
+
+        g.undo_trail(0)
+        assert g.get_mask(0) == ALL_CANDIDATES_MASK
+
+        with pytest.raises(ValueError):
+            g.undo_trail(3)
+
+    def test_trail_bulk_writes(self):
+        g = Grid()
+        g.start_trail()
+        g.set_values([1] * 81)
+        g.reset_masks()
+        g.undo_trail(0)
+        assert g.values == bytearray(81)
+
+        g.stop_trail()
+        assert g.is_trailing == False
+        assert g.copy().is_trailing == False
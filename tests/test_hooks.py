@@ -0,0 +1,100 @@
+import sys
+sys.path.append('..')
+from sudokupy.hooks import Hooks, HookEvent, SolverHooks
+from sudokupy.solver import Solver
+from sudokupy.board import Board
+import pytest
+
+class _CountingHooks(SolverHooks):
+    def __init__(self):
+        self.counts = {event: 0 for event in HookEvent}
+        self.solved_board = None
+
+    def on_deduce_start(self):
+        self.counts[HookEvent.DEDUCE_START] += 1
+
+    def on_deduce_end(self):
+        self.counts[HookEvent.DEDUCE_END] += 1
+
+    def on_eliminate(self, transactions):
+        assert len(transactions) > 0
+        self.counts[HookEvent.ELIMINATE] += 1
+
+    def on_injection_push(self, injection):
+        self.counts[HookEvent.INJECTION_PUSH] += 1
+
+    def on_injection_pop(self, injection):
+        self.counts[HookEvent.INJECTION_POP] += 1
+
+    def on_solve_end(self, board):
+        self.counts[HookEvent.SOLVE_END] += 1
+        self.solved_board = board
+
+class TestHooks:
+    def test_add_fire(self):
+        hooks = Hooks()
+        assert not hooks
+        calls = []
+        hooks.add(HookEvent.ELIMINATE, calls.append)
+        assert hooks
+        assert hooks.has(HookEvent.ELIMINATE)
+        assert not hooks.has(HookEvent.SOLVE_END)
+        hooks.fire(HookEvent.ELIMINATE, 1)
+        hooks.fire(HookEvent.SOLVE_END, 2)
+        assert calls == [1]
+
+        hooks.remove(HookEvent.ELIMINATE, calls.append)
+        assert not hooks
+
+    def test_add_hooks_registers_overridden_methods(self):
+        class OnlySolveEnd(SolverHooks):
+            def on_solve_end(self, board):
+                pass
+        hooks = Hooks()
+        hooks.add_hooks(OnlySolveEnd())
+        assert len(hooks) == 1
+        assert hooks.has(HookEvent.SOLVE_END)
+
+    def test_add_invalid(self):
+        hooks = Hooks()
+        with pytest.raises(TypeError):
+            hooks.add('eliminate', print)
+        with pytest.raises(TypeError):
+            hooks.add(HookEvent.ELIMINATE, None)
+        with pytest.raises(TypeError):
+            hooks.add_hooks(object())
+
+class TestSolverHooks:
+    def test_solve(self):
+        s = Solver(csv_filename='evil01.csv')
+        hooks = _CountingHooks()
+        s.add_hooks(hooks)
+        board = s.solve()
+        counts = hooks.counts
+        assert counts[HookEvent.SOLVE_END] == 1
+        assert hooks.solved_board is not board
+        assert hooks.solved_board.grid.values == board.grid.values
+        assert counts[HookEvent.DEDUCE_START] == counts[HookEvent.DEDUCE_END]
+        assert counts[HookEvent.DEDUCE_START] > 0
+        assert counts[HookEvent.ELIMINATE] > 0
+        assert counts[HookEvent.INJECTION_PUSH] == len(s.injections) + counts[HookEvent.INJECTION_POP]
+
+    def test_solve_no_solution(self):
+        b = Board('easy01.csv')
+        b.cell[1, 0].values = 9
+        s = Solver(b)
+        boards = []
+        s.add_callback(HookEvent.SOLVE_END, boards.append)
+        with pytest.raises(ValueError):
+            s.solve()
+        assert boards == [None]
+
+    def test_solve_many(self):
+        s = Solver()
+        boards = []
+        s.add_callback(HookEvent.SOLVE_END, boards.append)
+        results = list(s.solve_many([Board('easy01.csv'), Board('hard01.csv')]))
+        assert len(boards) == 2
+        assert boards[0].grid.values == results[0].grid.values
+        assert boards[1].grid.values == results[1].grid.values
+        assert boards[0].grid.values != boards[1].grid.values
@@ -1,13 +1,13 @@
 import sys
 sys.path.append('..')
 from sudokupy.board import Board
-from sudokupy.injector import Injector, _Injection
+from sudokupy.injector import Injector, CellSelection, HistoryMode, _Injection
 import pytest
 
 class TestInjection:
     def test_repr(self):
         b = Board()
-        injection = _Injection(b.cells.data[0][0], b.cells.get_candidates(True))
+        injection = _Injection(b.cells.data[0][0], 0)
         repr = injection.__repr__()
         sum = 0
         for i in range(0, 10):
@@ -16,7 +16,7 @@ class TestInjection:
 
     def test_has_untried_candidates(self):
         b = Board()
-        injection = _Injection(b.cells.data[0][0], b.cells.get_candidates(True))
+        injection = _Injection(b.cells.data[0][0], 0)
         assert injection.has_untried_candidates() == True
 
         for i in range(8):
@@ -28,30 +28,30 @@ class TestInjection:
     
     def test_untried_candidates(self):
         b = Board()
-        injection = _Injection(b.cells.data[0][0], b.cells.get_candidates(True))
+        injection = _Injection(b.cells.data[0][0], 0)
         assert len(injection.untried_candidates) == 9
         injection.guess()
         assert len(injection.untried_candidates) == 8
     
     def test_available_candidates(self):
         b = Board()
-        injection = _Injection(b.cells.data[0][0], b.cells.get_candidates(True))
+        injection = _Injection(b.cells.data[0][0], 0)
         assert len(injection.available_candidates) == 9
 
         b.cell[1, 1].candidates = [3, 5, 7]
-        injection = _Injection(b.cells.data[1][1], b.cells.get_candidates(True))
+        injection = _Injection(b.cells.data[1][1], 0)
         assert len(injection.available_candidates) == 3
     
     def test_cell(self):
         b = Board()
         cell = b.cells.data[0][0]
-        injection = _Injection(cell, b.cells.get_candidates(True))
+        injection = _Injection(cell, 0)
         assert injection.cell == cell
     
     def test_guess(self):
         b = Board()
         cell = b.cells.data[0][0]
-        injection = _Injection(cell, b.cells.get_candidates(True))
+        injection = _Injection(cell, 0)
 
         for i in range(9):
             print(i)
@@ -78,7 +78,7 @@ class TestInjector:
     
     def test_get_history(self):
         b = Board()
-        j = Injector(b.cells)
+        j = Injector(b.cells, history_mode=HistoryMode.FULL)
         history = j.get_history()
         assert history == []
 
@@ -86,6 +86,40 @@ class TestInjector:
         history = j.get_history()
         assert len(history) == 1
     
+    def test_history_modes(self):
+        def inject_with_rollback(history_mode, history_size=1000):
+            b = Board()
+            b.cells.candidates = []
+            b.cell[0, 0].candidates = [5, 6]
+            b.cell[8, 8].candidates = [1, 2, 3]
+            j = Injector(b.cells, history_mode=history_mode, history_size=history_size)
+            j.inject()
+            b.cell[8, 8].candidates = []
+            j.inject()
+            return j
+
+        j = inject_with_rollback(HistoryMode.FULL)
+        assert [entry['action'] for entry in j.get_history()] == ['new', 'pop', 'new']
+        assert (j.push_count, j.pop_count) == (2, 1)
+
+        j = inject_with_rollback(HistoryMode.BOUNDED, 2)
+        assert [entry['action'] for entry in j.get_history()] == ['pop', 'new']
+        assert (j.push_count, j.pop_count) == (2, 1)
+
+        j = inject_with_rollback(HistoryMode.COUNTERS)
+        assert j.history_mode == HistoryMode.COUNTERS
+        assert j.get_history() == []
+        assert (j.push_count, j.pop_count) == (2, 1)
+
+        j = inject_with_rollback(HistoryMode.OFF)
+        assert j.get_history() == []
+        assert (j.push_count, j.pop_count) == (0, 0)
+
+        with pytest.raises(TypeError):
+            j.set_history_mode('full')
+        with pytest.raises(ValueError):
+            j.set_history_mode(HistoryMode.BOUNDED, 0)
+    
     def test_get_injections(self):
         b = Board()
         j = Injector(b.cells)
@@ -140,3 +174,145 @@ class TestInjector:
         with pytest.raises(ValueError):
             j.inject()
 
+
+    def test_propagate(self):
+        b = Board()
+        j = Injector(b.cells, propagate=True)
+        assert j.propagate == True
+        b.cell[0, 0].candidates = [1]
+        b.cell[0, 1].candidates = [1, 2]
+        b.cell[5, 1].candidates = [2, 3]
+
+        j.inject()
+        assert b.cell[0, 0].values == [[1]]
+        assert b.cell[0, 1].values == [[2]]
+        assert b.cell[0, 1].candidates == [[[]]]
+        assert b.cell[5, 1].candidates == [[[]]]
+        assert b.cell[5, 1].values == [[3]]
+        assert len(j.injections) == 1
+        assert len(j.injections[0].propagated_cells) == 2
+        assert 1 not in b.cell[0, 8].candidates[0][0]
+        assert 2 not in b.cell[8, 1].candidates[0][0]
+        assert b.cells.get_cell(1) in j.affected_cells
+        assert j.dead_end == False
+    
+    def test_propagate_dead_end(self):
+        b = Board()
+        j = Injector(b.cells, propagate=True)
+        b.cell[0, 0].candidates = [1]
+        b.cell[0, 1].candidates = [1]
+
+        j.inject()
+        assert j.dead_end == True
+
+        with pytest.raises(ValueError):
+            j.inject()
+        assert b.cell[0, 0].values == [[0]]
+    
+    def test_propagate_conflicting_singles(self):
+        b = Board()
+        j = Injector(b.cells, propagate=True)
+        b.cell[0, 0].candidates = [1]
+        b.cell[0, 1].candidates = [1, 2]
+        b.cell[0, 2].candidates = [1, 2]
+
+        j.inject()
+        assert j.dead_end == True
+
+    def test_cell_selection_mrv(self):
+        b = Board()
+        j = Injector(b.cells, cell_selection=CellSelection.MINIMUM_REMAINING_VALUES)
+        assert j.cell_selection == CellSelection.MINIMUM_REMAINING_VALUES
+        b.cell[4, 4].candidates = [1, 2, 3]
+        b.cell[8, 8].candidates = [1, 2]
+        b.cell[7, 7].candidates = [3, 4, 5]
+
+        j.inject()
+        assert j.injections[0].cell == b.cells.get_cell(80)
+
+        b.cells.candidates = []
+        j.inject()
+        assert j.injections[-1].cell == j.injections[0].cell
+    
+    def test_cell_selection_mrv_degree(self):
+        b = Board()
+        j = Injector(b.cells, cell_selection=CellSelection.MINIMUM_REMAINING_VALUES_DEGREE)
+        b.row[0].values = [0, 0, 3, 4, 5, 6, 7, 8, 9]
+        b.cell[0, 0].candidates = [1, 2]
+        b.cell[4, 4].candidates = [1, 2]
+
+        j.inject()
+        assert j.injections[0].cell == b.cells.get_cell(40)
+    
+    @pytest.mark.parametrize('cell_selection', [CellSelection.MINIMUM_REMAINING_VALUES, CellSelection.MINIMUM_REMAINING_VALUES_DEGREE])
+    def test_cell_selection_mrv_dead_end(self, cell_selection):
+        b = Board()
+        j = Injector(b.cells, cell_selection=cell_selection)
+        b.cell[8, 8].candidates = [1, 2]
+
+        j.inject()
+        assert j.injections[0].cell == b.cells.get_cell(80)
+
+        b.cell[4, 4].candidates = []
+        j.inject()
+        assert j.rolled_back == True
+        assert len(j.injections) == 1
+        assert j.injections[0].cell == b.cells.get_cell(80)
+        assert b.cell[4, 4].candidates == [[list(range(1, 10))]]
+
+    def test_cell_selection_callable(self):
+        b = Board()
+        j = Injector(b.cells, cell_selection=lambda cells: cells.get_cell(80))
+        j.inject()
+        assert j.injections[0].cell == b.cells.get_cell(80)
+
+        with pytest.raises(TypeError):
+            j.set_cell_selection('invalid')
+
+    def test_rollback(self):
+        b = Board()
+        b.cells.candidates = []
+        b.cell[0, 0].candidates = [5, 6]
+        b.cell[8, 8].candidates = [1, 2, 3]
+        j = Injector(b.cells)
+
+        j.inject()
+        assert j.injections[0].trail_mark == 0
+        b.cell[8, 8].candidates = []
+
+        j.inject()
+        assert j.rolled_back == True
+        assert len(j.injections) == 1
+        assert b.cell[8, 8].candidates == [[[1, 2, 3]]]
+        assert b.cell[0, 0].values[0][0] in [5, 6]
+
+    def test_reset(self):
+        b = Board()
+        j = Injector(b.cells)
+        j.inject()
+        j.inject()
+        assert len(j.injections) == 2
+
+        b.grid.copy_from(Board().grid)
+        j.reset()
+        assert j.injections == []
+        assert j.get_history() == []
+        assert j.rolled_back == False
+        assert b.grid.get_trail_mark() == 0
+
+        j.inject()
+        assert len(j.injections) == 1
+        assert j.injections[0].trail_mark == 0
+
+class TestInjectorSeed:
+    def _inject_values(self, seed):
+        b = Board()
+        injector = Injector(b.cells, seed=seed)
+        for _ in range(5):
+            injector.inject()
+        return bytes(b.grid.values)
+
+    def test_seed(self):
+        assert self._inject_values(3) == self._inject_values(3)
+        values = {self._inject_values(seed) for seed in range(10)}
+        assert len(values) > 1
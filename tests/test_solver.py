@@ -0,0 +1,192 @@
+import sys
+sys.path.append('..')
+from sudokupy.solver import Solver, Engine
+from sudokupy.board import Board
+from sudokupy.grid import Grid
+from sudokupy.deducers.deducer import Deducers
+import pytest
+
+def _is_solved(board:Board, original:Board):
+    values = board.cells.get_values()
+    for unit in values + [list(col) for col in zip(*values)]:
+        if sorted(unit) != list(range(1, 10)):
+            return False
+    for value, original_value in zip(board.grid.values, original.grid.values):
+        if original_value != 0 and value != original_value:
+            return False
+    return True
+
+class TestSolver:
+    @pytest.mark.parametrize('filename', ['easy01.csv', 'hard01.csv', 'evil01.csv'])
+    def test_solve(self, filename):
+        s = Solver(csv_filename=filename)
+        board = s.solve()
+        assert _is_solved(board, s.unsolved_board)
+
+    @pytest.mark.parametrize('filename', ['easy01.csv', 'expert01.csv', 'evil02.csv'])
+    def test_solve_dancing_links(self, filename):
+        s = Solver(csv_filename=filename, engine=Engine.DANCING_LINKS)
+        assert s.engine == Engine.DANCING_LINKS
+        board = s.solve()
+        assert board is s.solved_board
+        assert _is_solved(board, s.unsolved_board)
+        assert board.cells.get_candidates(flatten=True) == [[]] * 81
+
+        s2 = Solver(csv_filename=filename)
+        assert s2.solve().cells == board.cells
+        assert s2.solved_board.cells.get_values() == board.cells.get_values()
+
+    def test_solve_many_does_not_record_loads(self, monkeypatch):
+        recorded = []
+        record_all = Grid._record_all
+        def record(grid):
+            recorded.append(grid)
+            record_all(grid)
+        monkeypatch.setattr(Grid, '_record_all', record)
+        boards = [Board('easy01.csv'), Board('hard01.csv')]
+        assert None not in list(Solver().solve_many(boards))
+        assert recorded == []
+
+    def test_seed(self):
+        counts = []
+        for _ in range(2):
+            s = Solver(Board('evil01.csv'), seed=1)
+            s.solve()
+            counts.append((s._injector.push_count, s._injector.pop_count))
+        assert counts[0] == counts[1]
+
+        s = Solver(Board('evil01.csv'))
+        s.set_seed(1)
+        s.solve()
+        assert (s._injector.push_count, s._injector.pop_count) == counts[0]
+
+    @pytest.mark.parametrize('engine', [Engine.DEDUCTION, Engine.DANCING_LINKS])
+    def test_solve_many(self, engine):
+        filenames = ['easy01.csv', 'hard01.csv', 'expert01.csv', 'evil02.csv', 'easy01.csv']
+        boards = [Board(filename) for filename in filenames]
+        s = Solver(engine=engine)
+        results = list(s.solve_many(board for board in boards))
+        assert len(results) == len(boards)
+        for result, board in zip(results, boards):
+            assert _is_solved(result, board)
+        assert results[0].grid is not results[4].grid
+        assert results[0].cells == results[4].cells
+
+    def test_solve_many_no_solution(self):
+        b = Board('easy01.csv')
+        b.cell[1, 0].values = 9 # no conflicting peer, but not the solution's value
+        results = list(Solver().solve_many([Board('easy01.csv'), b, Board('hard01.csv')]))
+        assert results[1] is None
+        assert _is_solved(results[0], Board('easy01.csv'))
+        assert _is_solved(results[2], Board('hard01.csv'))
+
+    def test_solve_many_lazy(self):
+        def boards():
+            yield Board('easy01.csv')
+            raise RuntimeError('consumed too far')
+        results = Solver().solve_many(boards())
+        assert _is_solved(next(results), Board('easy01.csv'))
+
+        with pytest.raises(TypeError):
+            list(Solver().solve_many([[0] * 81]))
+
+    @pytest.mark.parametrize('engine', [Engine.DEDUCTION, Engine.DANCING_LINKS])
+    def test_solve_many_workers(self, engine):
+        filenames = ['easy01.csv', 'hard01.csv', 'expert01.csv', 'evil02.csv', 'medium01.csv']
+        boards = [Board(filename) for filename in filenames]
+        results = list(Solver(engine=engine).solve_many(iter(boards), workers=2, chunksize=2))
+        assert len(results) == len(boards)
+        for result, board in zip(results, boards):
+            assert _is_solved(result, board)
+            assert result.cells.get_candidates(flatten=True) == [[]] * 81
+
+    def test_solve_many_unordered(self):
+        filenames = ['easy01.csv', 'hard01.csv', 'medium01.csv']
+        boards = [Board(filename) for filename in filenames]
+        for workers in [1, 2]:
+            results = list(Solver().solve_many(boards, workers=workers, ordered=False))
+            assert sorted(index for index, _ in results) == [0, 1, 2]
+            for index, result in results:
+                assert _is_solved(result, boards[index])
+
+    @pytest.mark.parametrize('engine', [Engine.DEDUCTION, Engine.DANCING_LINKS])
+    def test_solve_many_timeout(self, engine):
+        boards = [Board('evil01.csv'), Board('easy01.csv')]
+        assert list(Solver(engine=engine).solve_many(boards, timeout=0)) == [None, None]
+        assert list(Solver(engine=engine).solve_many(boards, workers=2, timeout=0)) == [None, None]
+        assert None not in list(Solver(engine=engine).solve_many(boards, timeout=60))
+        with pytest.raises(TimeoutError):
+            Solver(Board('evil01.csv'), engine=engine).solve(timeout=0)
+
+    def test_solve_many_invalid(self):
+        with pytest.raises(ValueError):
+            Solver().solve_many([Board('easy01.csv')], workers=0)
+        with pytest.raises(TypeError):
+            list(Solver().solve_many([[0] * 81], workers=2))
+
+    def test_solve_many_from_lines(self, tmpdir):
+        from sudokupy.file import File
+        boards = [Board('easy01.csv'), Board('hard01.csv')]
+        file = File(tmpdir)
+        file.to_lines(boards, 'puzzles.txt')
+        for workers in [1, 2]:
+            results = list(Solver().solve_many(file.iter_lines('puzzles.txt'), workers=workers))
+            for result, board in zip(results, boards):
+                assert _is_solved(result, board)
+
+    def test_stats(self):
+        s = Solver(csv_filename='hard01.csv')
+        assert s.stats is None
+        s.enable_stats()
+        s.solve()
+        stats = s.stats
+        assert set(stats) == set(Deducers)
+        value_stats = stats[Deducers.VALUE_DEDUCER]
+        assert value_stats.calls >= 27
+        assert value_stats.time > 0
+        assert value_stats.transactions > 0
+        assert value_stats.eliminated > 0
+        assert set(value_stats.to_dict()) == {'calls', 'time', 'transactions', 'eliminated'}
+
+        calls = value_stats.calls
+        list(s.solve_many([Board('easy01.csv')]))
+        assert s.stats[Deducers.VALUE_DEDUCER].calls > calls
+
+        s.disable_stats()
+        assert s.stats is None
+
+    def test_solve_dancing_links_no_solution(self):
+        b = Board()
+        b.row[0].values = [1, 1, 0, 0, 0, 0, 0, 0, 0]
+        s = Solver(b, engine=Engine.DANCING_LINKS)
+        with pytest.raises(ValueError):
+            s.solve()
+
+    def test_solutions(self):
+        b = Board()
+        s = Solver(b)
+        solutions = list(s.solutions(limit=3))
+        assert len(solutions) == 3
+        for solution in solutions:
+            assert _is_solved(solution, b)
+        assert solutions[0].grid is not solutions[1].grid
+        assert s.unsolved_board.grid.values == bytearray(81)
+
+    def test_count_solutions(self):
+        s = Solver(csv_filename='evil01.csv')
+        assert s.count_solutions() == 1
+        assert s.count_solutions(limit=None) == 1
+
+        b = Board('evil01.csv')
+        b.cell[0, 0].values = 0
+        b.cell[0, 1].values = 0
+        b.cell[1, 3].values = 0
+        s = Solver(b)
+        assert s.count_solutions() == 2
+        assert s.count_solutions(limit=1) == 1
+
+        assert Solver(Board()).count_solutions(limit=50) == 50
+
+        b = Board()
+        b.row[0].values = [1, 1, 0, 0, 0, 0, 0, 0, 0]
+        assert Solver(b).count_solutions() == 0
@@ -0,0 +1,60 @@
+import sys
+sys.path.append('..')
+from sudokupy.store import PuzzleStore, _pack_values, _unpack_values
+from sudokupy.file import File
+from sudokupy.cell import Cells
+import pytest
+
+class TestPuzzleStore:
+    def _values(self, cells_list):
+        return [bytes(cells.grid.values) for cells in cells_list]
+
+    def _read_boards(self):
+        file = File()
+        return [file.read_csv(filename) for filename in ['easy01.csv', 'hard01.csv', 'evil01.csv']]
+
+    @pytest.mark.parametrize('cell_bits', [4, 8])
+    def test_pack_values(self, cell_bits):
+        values = bytes(i % 10 for i in range(81))
+        packed = _pack_values(values, cell_bits)
+        assert len(packed) == {4: 41, 8: 81}[cell_bits]
+        assert _unpack_values(packed, cell_bits) == values
+
+    @pytest.mark.parametrize('cell_bits', [4, 8])
+    def test_write_read(self, tmpdir, cell_bits):
+        boards = self._read_boards()
+        path = tmpdir / 'puzzles.sdk'
+        assert PuzzleStore.write(path, iter(boards), cell_bits) == 3
+        assert path.size() == 16 + 3 * {4: 41, 8: 81}[cell_bits]
+
+        with PuzzleStore(path) as store:
+            assert len(store) == 3
+            assert store.cell_bits == cell_bits
+            assert self._values([store[1], store[-1]]) == self._values([boards[1], boards[2]])
+            assert self._values(store) == self._values(boards)
+            assert [bytes(store.get_values(i)) for i in range(3)] == self._values(boards)
+            with pytest.raises(IndexError):
+                store[3]
+
+    def test_file(self, tmpdir):
+        boards = self._read_boards()
+        file = File(tmpdir)
+        assert file.to_store(boards, 'puzzles.sdk') == 3
+        with file.open_store('puzzles.sdk') as store:
+            assert self._values(store) == self._values(boards)
+        with pytest.raises(FileExistsError):
+            file.open_store('missing.sdk')
+
+    def test_invalid(self, tmpdir):
+        path = tmpdir / 'puzzles.sdk'
+        path.write_binary(b'not a puzzle store')
+        with pytest.raises(ValueError):
+            PuzzleStore(path)
+
+        PuzzleStore.write(path, [Cells()], 8)
+        path.write_binary(path.read_binary()[:-1])
+        with pytest.raises(ValueError):
+            PuzzleStore(path)
+
+        with pytest.raises(ValueError):
+            PuzzleStore.write(path, [Cells()], 2)